@@ -2,20 +2,37 @@
 """
 Main application entry point for Food Impact API
 """
+import atexit
 import os
 import logging
+import logging.handlers
+import queue
 from app import create_app
 from config.config import get_config
 
-# Configure logging
+# Configure logging. Handlers sit behind a queue so request threads only pay
+# for an enqueue; the listener thread does the actual stream/file writes.
+_log_queue = queue.SimpleQueue()
+_queue_handler = logging.handlers.QueueHandler(_log_queue)
 logging.basicConfig(
     level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(),
-        logging.FileHandler('app.log')
-    ]
+    handlers=[_queue_handler]
 )
+# Leave formatting to the listener's handlers; the queue side passes the
+# record through untouched
+_queue_handler.setFormatter(logging.Formatter('%(message)s'))
+_log_listener = logging.handlers.QueueListener(
+    _log_queue,
+    logging.StreamHandler(),
+    logging.FileHandler('app.log'),
+    respect_handler_level=True
+)
+for _handler in _log_listener.handlers:
+    _handler.setFormatter(logging.Formatter(
+        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    ))
+_log_listener.start()
+atexit.register(_log_listener.stop)
 
 logger = logging.getLogger(__name__)
 
@@ -42,10 +59,13 @@ def main():
 
         logger.info(f"Server starting on {host}:{port}")
 
+        # threaded=True lets the dev server overlap requests that are mostly
+        # waiting on the AI API; production runs behind Lambda/serverless-wsgi
         app.run(
             host=host,
             port=port,
-            debug=app.config['DEBUG']
+            debug=app.config['DEBUG'],
+            threaded=True
         )
 
     except Exception as e:
@@ -1,29 +1,129 @@
-from flask import Flask
+import gzip
+import zlib
+
+from decimal import Decimal
+
+from flask import Flask, request
+from flask.json.provider import JSONProvider
 from flask_cors import CORS
+from werkzeug.middleware.proxy_fix import ProxyFix
+import orjson
 import os
 from dotenv import load_dotenv
 
+# Responses smaller than this are cheaper to send raw than to compress
+_GZIP_MIN_SIZE = 1024
+
+
+def _gzip_stream(chunks):
+    """Incrementally gzip a streamed response body, chunk by chunk
+
+    Keeps the streaming behavior (first bytes go out before the last chunk
+    is produced) while still compressing the largest payloads we serve.
+    """
+    # wbits=16+MAX_WBITS makes zlib emit a gzip-wrapped stream
+    compressor = zlib.compressobj(6, zlib.DEFLATED, 16 + zlib.MAX_WBITS)
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode()
+        data = compressor.compress(chunk)
+        if data:
+            yield data
+    yield compressor.flush()
+
+
+def _json_default(obj):
+    """Serialize DynamoDB's Decimal numbers without a recursive pre-pass"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
 # Load environment variables
 load_dotenv()
 
+
+class OrjsonProvider(JSONProvider):
+    """JSON provider backed by orjson so request parsing and jsonify use the C codec
+
+    orjson never sorts keys or emits pretty-print whitespace, so the stdlib
+    provider's sort_keys/indent work is gone by construction; the attributes
+    below just make that explicit for anything that inspects the provider.
+    """
+
+    sort_keys = False
+    compact = True
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=_json_default).decode()
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+
 def create_app():
     """Application factory pattern for Flask app creation"""
     app = Flask(__name__)
+    app.json = OrjsonProvider(app)
+    # One trusted proxy hop (API Gateway / dev proxy) sets X-Forwarded-For;
+    # ProxyFix folds it into remote_addr so rate limiting sees the real client
+    app.wsgi_app = ProxyFix(app.wsgi_app, x_for=1, x_proto=1)
 
     # Configuration
     app.config['SECRET_KEY'] = os.getenv('SECRET_KEY', 'dev-secret-key')
     app.config['DEBUG'] = os.getenv('FLASK_ENV') == 'development'
+    # Largest legitimate payload is a list of ~100 short food/nutrient
+    # entries; reject oversized bodies before they are read and parsed
+    app.config['MAX_CONTENT_LENGTH'] = 256 * 1024
 
     # Enable CORS for mobile app integration
-    CORS(app, origins=["*"])  # In production, restrict to specific origins
+    # max_age lets clients cache the preflight response for 24h, so repeat
+    # POSTs skip the extra OPTIONS round trip
+    CORS(
+        app,
+        origins=["*"],  # In production, restrict to specific origins
+        methods=['GET', 'POST', 'OPTIONS'],
+        allow_headers=['Content-Type', 'Authorization'],
+        max_age=86400
+    )
 
     # Register blueprints
     from app.routes.api import api_bp
     app.register_blueprint(api_bp, url_prefix='/api')
 
-    # Health check endpoint
+    # Compress sizeable JSON bodies for clients that accept gzip; analysis
+    # responses shrink several-fold, which matters most on mobile links
+    @app.after_request
+    def _compress_response(response):
+        if (response.status_code != 200
+                or response.direct_passthrough
+                or 'Content-Encoding' in response.headers
+                or 'gzip' not in request.headers.get('Accept-Encoding', '').lower()):
+            return response
+
+        # Streamed bodies (analyze-food arrays, completed job results) are
+        # exactly the payloads that get large; compress them incrementally
+        # instead of buffering the whole body
+        if response.is_streamed:
+            response.response = _gzip_stream(response.response)
+            response.headers['Content-Encoding'] = 'gzip'
+            response.headers.pop('Content-Length', None)
+            response.headers.add('Vary', 'Accept-Encoding')
+            return response
+
+        if (response.content_length is None
+                or response.content_length < _GZIP_MIN_SIZE):
+            return response
+
+        response.set_data(gzip.compress(response.get_data(), compresslevel=6))
+        response.headers['Content-Encoding'] = 'gzip'
+        response.headers.add('Vary', 'Accept-Encoding')
+        return response
+
+    # Health check endpoint; body is static, so serve pre-serialized bytes
+    health_body = orjson.dumps({'status': 'healthy', 'service': 'food-impact-api'})
+
     @app.route('/health')
     def health_check():
-        return {'status': 'healthy', 'service': 'food-impact-api'}
+        return app.response_class(health_body, mimetype='application/json')
 
     return app
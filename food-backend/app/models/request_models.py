@@ -2,7 +2,7 @@ from typing import Optional
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class UserProfile:
     """User profile data for personalized recommendations"""
     age_group: str  # '0-18', '19-40', '>40'
@@ -13,7 +13,7 @@ class UserProfile:
     updated_at: str
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FoodAnalysisRequest:
     """Request model for food analysis with optional profile data and portion specification"""
     food_name: str
@@ -38,7 +38,7 @@ class FoodAnalysisRequest:
         return result
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MealAnalysisRequest:
     """Request model for single-prompt meal analysis"""
     food_name: str
@@ -52,7 +52,7 @@ class MealAnalysisRequest:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class NutrientConsumed:
     """Represents a nutrient consumed on a given day"""
     name: str
@@ -68,7 +68,7 @@ class NutrientConsumed:
         }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class RecommendedIntakeRequest:
     """Request model for recommended daily intake based on consumed nutrients"""
     nutrients_consumed: list[NutrientConsumed]
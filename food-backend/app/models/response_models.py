@@ -1,5 +1,5 @@
-from typing import List, Dict, Any, Optional
-from dataclasses import dataclass, asdict
+from typing import List, Dict, Any, NamedTuple, Optional
+from dataclasses import dataclass, field
 from enum import Enum
 
 
@@ -14,7 +14,11 @@ class TipCategory(Enum):
     MINDSET = 'mindset'
 
 
-@dataclass
+# Enum-to-value lookup so serialization avoids repeated .value descriptor access
+_CATEGORY_VALUES = {category: category.value for category in TipCategory}
+
+
+@dataclass(slots=True, frozen=True)
 class CategorizedTip:
     """Represents a health tip with categorization information"""
     id: str
@@ -23,20 +27,22 @@ class CategorizedTip:
     content: str
     priority: str = 'medium'  # 'high', 'medium', 'low'
     relevance_score: float = 1.0
-    tags: List[str] = None
-
-    def __post_init__(self):
-        if self.tags is None:
-            self.tags = []
+    tags: List[str] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        result = asdict(self)
-        result['category'] = self.category.value
-        return result
-
-
-@dataclass
+        return {
+            'id': self.id,
+            'category': _CATEGORY_VALUES[self.category],
+            'title': self.title,
+            'content': self.content,
+            'priority': self.priority,
+            'relevance_score': self.relevance_score,
+            'tags': self.tags,
+        }
+
+
+@dataclass(slots=True, frozen=True)
 class IngredientQuantity:
     """Represents an ingredient with quantity information"""
     name: str
@@ -47,10 +53,16 @@ class IngredientQuantity:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        return asdict(self)
+        return {
+            'name': self.name,
+            'original_amount': self.original_amount,
+            'gram_amount': self.gram_amount,
+            'unit': self.unit,
+            'per_person': self.per_person,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubstanceContribution:
     """Represents a substance contribution from an ingredient"""
     ingredient_name: str
@@ -60,10 +72,15 @@ class SubstanceContribution:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        return asdict(self)
+        return {
+            'ingredient_name': self.ingredient_name,
+            'quantity_grams': self.quantity_grams,
+            'contribution_percentage': self.contribution_percentage,
+            'relationship_type': self.relationship_type,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class SubstanceRelationship:
     """Represents a substance and its relationships to ingredients"""
     name: str
@@ -71,20 +88,21 @@ class SubstanceRelationship:
     health_impact: str = "neutral"  # 'positive', 'negative', 'neutral'
     total_quantity: Optional[float] = None
     unit: str = "mg"
-    contributions: List[SubstanceContribution] = None
-
-    def __post_init__(self):
-        if self.contributions is None:
-            self.contributions = []
+    contributions: List[SubstanceContribution] = field(default_factory=list)
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        result = asdict(self)
-        result['contributions'] = [contrib.to_dict() for contrib in self.contributions]
-        return result
+        return {
+            'name': self.name,
+            'category': self.category,
+            'health_impact': self.health_impact,
+            'total_quantity': self.total_quantity,
+            'unit': self.unit,
+            'contributions': [contrib.to_dict() for contrib in self.contributions],
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class FoodAnalysisResponse:
     """Structured response for food analysis with quantity information and relationships"""
     ingredients: List[str]  # Original ingredient list for backward compatibility
@@ -99,15 +117,24 @@ class FoodAnalysisResponse:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        result = asdict(self)
-        # Convert complex objects to dict format
-        result['ingredient_quantities'] = [iq.to_dict() for iq in self.ingredient_quantities]
-        result['substance_relationships'] = [sr.to_dict() for sr in self.substance_relationships]
-        result['categorized_tips'] = [ct.to_dict() for ct in self.categorized_tips]
-        return result
-
-
-@dataclass
+        # Bind the bound methods once instead of resolving them per element
+        iq_to_dict = IngredientQuantity.to_dict
+        sr_to_dict = SubstanceRelationship.to_dict
+        ct_to_dict = CategorizedTip.to_dict
+        return {
+            'ingredients': self.ingredients,
+            'ingredient_quantities': [iq_to_dict(iq) for iq in self.ingredient_quantities],
+            'substances': self.substances,
+            'substance_relationships': [sr_to_dict(sr) for sr in self.substance_relationships],
+            'mitigation_tips': self.mitigation_tips,
+            'categorized_tips': [ct_to_dict(ct) for ct in self.categorized_tips],
+            'disclaimer': self.disclaimer,
+            'portion_for_one': self.portion_for_one,
+            'personalized_recommendations': self.personalized_recommendations,
+        }
+
+
+@dataclass(slots=True, frozen=True)
 class ErrorResponse:
     """Structured error response"""
     error: str
@@ -116,22 +143,27 @@ class ErrorResponse:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        return asdict(self)
+        return {
+            'error': self.error,
+            'code': self.code,
+            'details': self.details,
+        }
 
 
-@dataclass
-class MealIngredient:
+class MealIngredient(NamedTuple):
     """Represents an ingredient in a meal with quantity"""
     name: str
     quantity: str
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        return asdict(self)
+        return {
+            'name': self.name,
+            'quantity': self.quantity,
+        }
 
 
-@dataclass
-class MealSubstance:
+class MealSubstance(NamedTuple):
     """Represents a substance in a meal with quantity and health info"""
     name: str
     quantity: float
@@ -142,10 +174,17 @@ class MealSubstance:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        return asdict(self)
+        return {
+            'name': self.name,
+            'quantity': self.quantity,
+            'unit': self.unit,
+            'category': self.category,
+            'standard_consumption': self.standard_consumption,
+            'health_impact': self.health_impact,
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class MealAnalysisResponse:
     """Response for single-prompt meal analysis"""
     food_name: str
@@ -155,13 +194,17 @@ class MealAnalysisResponse:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        result = asdict(self)
-        result['ingredients'] = [ing.to_dict() for ing in self.ingredients]
-        result['substances'] = [sub.to_dict() for sub in self.substances]
-        return result
+        ing_to_dict = MealIngredient.to_dict
+        sub_to_dict = MealSubstance.to_dict
+        return {
+            'food_name': self.food_name,
+            'meal_type': self.meal_type,
+            'ingredients': [ing_to_dict(ing) for ing in self.ingredients],
+            'substances': [sub_to_dict(sub) for sub in self.substances],
+        }
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class HealthResponse:
     """Health check response"""
     status: str
@@ -171,4 +214,9 @@ class HealthResponse:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON response"""
-        return asdict(self)
+        return {
+            'status': self.status,
+            'service': self.service,
+            'version': self.version,
+            'uptime': self.uptime,
+        }
@@ -1,7 +1,13 @@
-from flask import Blueprint, request, jsonify, current_app
+from flask import Blueprint, request, jsonify, current_app, g
+from werkzeug.exceptions import HTTPException
+import functools
+import hashlib
 import logging
+import threading
+import orjson
+from cachetools import TTLCache
 from decimal import Decimal
-from app.services.food_analyzer import FoodAnalyzer
+from enum import Enum
 from app.utils.validators import validate_food_name
 from app.utils.rate_limiter import RateLimiter
 from app.models.request_models import FoodAnalysisRequest, UserProfile, MealAnalysisRequest, RecommendedIntakeRequest, NutrientConsumed
@@ -9,434 +15,604 @@ from app.models.request_models import FoodAnalysisRequest, UserProfile, MealAnal
 api_bp = Blueprint('api', __name__)
 
 # Initialize services
-food_analyzer = FoodAnalyzer()
 rate_limiter = RateLimiter()
 
-# Import job manager for async processing
-try:
-    from app.services.job_manager import JobManager
-    job_manager = JobManager()
-except ImportError:
-    job_manager = None
-
 logger = logging.getLogger(__name__)
 
-def convert_decimals_to_floats(obj):
+# Heavy services (OpenAI client, boto3 resources) are created on first use
+# instead of at import time, so cold-start only pays for what the request needs
+
+@functools.cache
+def _get_food_analyzer():
+    """Lazily create the shared FoodAnalyzer instance"""
+    from app.services.food_analyzer import FoodAnalyzer
+    return FoodAnalyzer()
+
+
+@functools.cache
+def _get_job_manager():
+    """Lazily create the shared JobManager, or None when async processing is unavailable"""
+    try:
+        from app.services.job_manager import JobManager
+        return JobManager()
+    except Exception as e:
+        logger.warning("Job manager unavailable: %s", e)
+        return None
+
+# Validation constants hoisted out of the per-request hot path
+_VALID_MEAL_TYPES = frozenset(('breakfast', 'lunch', 'dinner', 'snack'))
+_VALID_MEAL_TYPES_STR = 'breakfast, lunch, dinner, snack'
+_VALID_AGE_GROUPS = frozenset(('0-18', '19-40', '18-29', '>40'))
+_VALID_AGE_GROUPS_STR = '0-18, 19-40, 18-29, >40'
+_VALID_GENDERS = frozenset(('male', 'female', 'general'))
+_VALID_GENDERS_STR = 'male, female, general'
+
+# Upper bound on foods per request; keeps prompt size and analysis time sane
+_MAX_FOOD_ITEMS = 100
+
+# Required keys of a nutrient item; checked as a set against dict.keys()
+_NUTRIENT_REQUIRED = frozenset(('name', 'total_amount'))
+
+# Short-lived cache of analyze-food results so identical payloads within the
+# TTL skip the AI round trip; the model output is stable enough for 5 minutes
+_analyze_cache = TTLCache(maxsize=256, ttl=300)
+_analyze_cache_lock = threading.Lock()
+
+# Same idea for the intake/neutralization endpoints; keys carry an endpoint
+# tag plus order-insensitive canonicalized inputs
+_recommendation_cache = TTLCache(maxsize=256, ttl=300)
+_recommendation_cache_lock = threading.Lock()
+
+
+def _cached_recommendation(cache_key, compute):
+    """Return a cached recommendation result, computing and storing on miss"""
+    with _recommendation_cache_lock:
+        result = _recommendation_cache.get(cache_key)
+    if result is None:
+        result = compute()
+        with _recommendation_cache_lock:
+            _recommendation_cache[cache_key] = result
+    return result
+
+
+def _intake_cache_key(tag, validated_nutrients, age_group, gender):
+    """Canonical cache key for an intake request; nutrient order is irrelevant"""
+    return (
+        tag,
+        tuple(sorted(
+            (n['name'].casefold(), n['total_amount'], n['unit'])
+            for n in validated_nutrients
+        )),
+        age_group,
+        gender,
+    )
+
+# Replay cache for the async-create endpoints: clients that retry a POST
+# (network hiccup, aggressive retry policy) with the same Idempotency-Key get
+# the original 202 back instead of queueing a duplicate job
+_idempotency_cache = TTLCache(maxsize=1024, ttl=600)
+_idempotency_cache_lock = threading.Lock()
+
+
+def _idempotent_replay():
+    """Look up a cached response for the request's Idempotency-Key
+
+    Returns (cache_key, response). Both are None when no key was sent; the
+    response is None on a miss, in which case the handler should process the
+    request and record its 202 via _async_accepted.
     """
-    Recursively convert Decimal values to float for JSON serialization
+    key = request.headers.get('Idempotency-Key')
+    if not key:
+        return None, None
+    # Replays are scoped to identical duplicates: a key reused with a
+    # different body misses and goes through normal validation instead of
+    # returning another request's job
+    body_digest = hashlib.sha256(request.get_data()).digest()
+    cache_key = (g.client_ip, request.path, key, body_digest)
+    with _idempotency_cache_lock:
+        cached = _idempotency_cache.get(cache_key)
+    if cached is None:
+        return cache_key, None
+    return cache_key, current_app.response_class(
+        cached, status=202, mimetype='application/json')
+
+
+def _async_accepted(idem_key, payload):
+    """Serialize a 202 job-accepted payload, recording it for idempotent replay"""
+    body = orjson.dumps(payload)
+    if idem_key is not None:
+        with _idempotency_cache_lock:
+            _idempotency_cache[idem_key] = body
+    return current_app.response_class(body, status=202, mimetype='application/json')
+
+# Fixed-message error responses, serialized once at import; handlers return
+# them through _error_response instead of re-encoding the same dict each time
+_ERRORS = {
+    code: (orjson.dumps({'error': message, 'code': code}), status)
+    for code, message, status in (
+        ('RATE_LIMIT_EXCEEDED', 'Rate limit exceeded. Please try again later.', 429),
+        ('REQUEST_TOO_LARGE', 'Request body too large', 413),
+        ('MISSING_DATA', 'Missing request data', 400),
+        ('INVALID_INPUT_FORMAT', 'Input must be an array of food objects', 400),
+        ('EMPTY_FOOD_ARRAY', 'Food array cannot be empty', 400),
+        ('TOO_MANY_FOOD_ITEMS', f'Too many food items; maximum is {_MAX_FOOD_ITEMS} per request', 400),
+        ('MISSING_NUTRIENTS_CONSUMED', 'Missing nutrients_consumed field', 400),
+        ('INVALID_NUTRIENTS_FORMAT', 'nutrients_consumed must be an array', 400),
+        ('EMPTY_NUTRIENTS_ARRAY', 'nutrients_consumed array cannot be empty', 400),
+        ('INVALID_AGE_GROUP', f'Invalid age_group. Must be one of: {_VALID_AGE_GROUPS_STR}', 400),
+        ('INVALID_GENDER', f'Invalid gender. Must be one of: {_VALID_GENDERS_STR}', 400),
+        ('NO_VALID_NUTRIENTS', 'No valid nutrients found in the request. All nutrients were filtered out due to invalid or zero amounts.', 400),
+        ('MISSING_OVERDOSED_SUBSTANCES', 'Missing overdosed_substances field', 400),
+        ('INVALID_OVERDOSED_SUBSTANCES_FORMAT', 'overdosed_substances must be an array', 400),
+        ('EMPTY_OVERDOSED_SUBSTANCES_ARRAY', 'overdosed_substances array cannot be empty', 400),
+        ('ASYNC_NOT_AVAILABLE', 'Asynchronous processing not available', 503),
+        ('JOB_STATUS_NOT_AVAILABLE', 'Job status checking not available', 503),
+        ('JOB_NOT_FOUND', 'Job not found', 404),
+        ('INTERNAL_ERROR', 'Internal server error. Please try again later.', 500),
+    )
+}
+
+
+def _error_response(code):
+    """Return the pre-serialized error response for a fixed error code"""
+    body, status = _ERRORS[code]
+    return current_app.response_class(body, status=status, mimetype='application/json')
+
+
+def _client_ip():
+    """Best-effort client address for rate limiting and logs
+
+    ProxyFix normally folds X-Forwarded-For into remote_addr; if remote_addr
+    is unset (bare WSGI invocations), fall back to the header's first token,
+    which is the originating client rather than an intermediate proxy.
     """
-    if isinstance(obj, Decimal):
-        return float(obj)
-    elif isinstance(obj, dict):
-        return {key: convert_decimals_to_floats(value) for key, value in obj.items()}
-    elif isinstance(obj, list):
-        return [convert_decimals_to_floats(item) for item in obj]
-    else:
-        return obj
+    if request.remote_addr:
+        return request.remote_addr
+    forwarded = request.environ.get('HTTP_X_FORWARDED_FOR')
+    if forwarded:
+        return forwarded.split(',', 1)[0].strip()
+    return 'unknown'
 
-@api_bp.route('/analyze-food', methods=['POST'])
-def analyze_food():
-    """
-    Analyze food impact endpoint using comprehensive nutritional analysis
-    Expects: [{"food_name": "string", "meal_type": "breakfast|lunch|dinner|snack"}, ...]
-    Returns: [{"food_name": "string", "meal_type": "string", "serving": {...}, "ingredients": [...], "nutrients_g": {...}}]
+
+def _get_request_json():
+    """Parse the request body with orjson directly
+
+    Skips Flask's mimetype negotiation and per-request caching of the parsed
+    body. Returns None for an empty or unparseable body, which the callers
+    already treat as MISSING_DATA.
     """
+    body = request.get_data(cache=False)
+    if not body:
+        return None
     try:
-        # Get client IP for rate limiting
-        client_ip = request.remote_addr or request.environ.get('HTTP_X_FORWARDED_FOR', 'unknown')
+        return orjson.loads(body)
+    except orjson.JSONDecodeError:
+        return None
 
-        # Check rate limit
-        if not rate_limiter.is_allowed(client_ip):
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return jsonify({
-                'error': 'Rate limit exceeded. Please try again later.',
-                'code': 'RATE_LIMIT_EXCEEDED'
-            }), 429
 
-        # Get and validate input
-        data = request.get_json()
+def _json_default(obj):
+    """Fallback serializer for types orjson does not handle natively"""
+    if isinstance(obj, Decimal):
+        return float(obj)
+    if isinstance(obj, Enum):
+        return obj.value
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
 
-        if not data:
-            return jsonify({
-                'error': 'Missing request data',
-                'code': 'MISSING_DATA'
-            }), 400
 
-        # Expect an array of food objects
-        if not isinstance(data, list):
-            return jsonify({
-                'error': 'Input must be an array of food objects',
-                'code': 'INVALID_INPUT_FORMAT'
-            }), 400
+def _json_response(payload, status=200):
+    """Serialize a response payload with orjson, bypassing the stdlib json encoder"""
+    return current_app.response_class(
+        orjson.dumps(payload, default=_json_default),
+        status=status,
+        mimetype='application/json'
+    )
 
-        if len(data) == 0:
-            return jsonify({
-                'error': 'Food array cannot be empty',
-                'code': 'EMPTY_FOOD_ARRAY'
-            }), 400
 
-        # Validate each food item
-        validated_foods = []
-        for i, food_item in enumerate(data):
-            if not isinstance(food_item, dict):
-                return jsonify({
-                    'error': f'Food item at index {i} must be an object',
-                    'code': 'INVALID_FOOD_ITEM'
-                }), 400
-
-            if 'food_name' not in food_item:
-                return jsonify({
-                    'error': f'Missing food_name in food item at index {i}',
-                    'code': 'MISSING_FOOD_NAME'
-                }), 400
-
-            if 'meal_type' not in food_item:
-                return jsonify({
-                    'error': f'Missing meal_type in food item at index {i}',
-                    'code': 'MISSING_MEAL_TYPE'
-                }), 400
-
-            food_name = food_item['food_name'].strip()
-            meal_type = food_item['meal_type'].strip()
-
-            # Validate food name
-            validation_result = validate_food_name(food_name)
-            if not validation_result['valid']:
-                return jsonify({
-                    'error': f'Invalid food_name at index {i}: {validation_result["error"]}',
-                    'code': 'INVALID_FOOD_NAME'
-                }), 400
-
-            # Validate meal type
-            valid_meal_types = ['breakfast', 'lunch', 'dinner', 'snack']
-            if meal_type not in valid_meal_types:
-                return jsonify({
-                    'error': f'Invalid meal_type at index {i}. Must be one of: {", ".join(valid_meal_types)}',
-                    'code': 'INVALID_MEAL_TYPE'
-                }), 400
+def _stream_json_array(items):
+    """Yield a JSON array one element at a time
 
-            validated_foods.append({
-                'food_name': food_name,
-                'meal_type': meal_type
-            })
+    Serializing per food item keeps the peak buffer at one item instead of
+    the whole result and lets the first bytes go out while the rest encode.
+    """
+    dumps = orjson.dumps
+    yield b'['
+    for i, item in enumerate(items):
+        if i:
+            yield b','
+        yield dumps(item, default=_json_default)
+    yield b']'
+
+
+# Endpoints that cannot run without the job manager, mapped to the error
+# each should surface; checked once in the before_request hook so the
+# handlers themselves stay on the happy path
+_JOB_MANAGER_ENDPOINTS = {
+    'api.get_recommended_intake_async': 'ASYNC_NOT_AVAILABLE',
+    'api.get_neutralization_recommendations_async': 'ASYNC_NOT_AVAILABLE',
+    'api.analyze_food_async': 'ASYNC_NOT_AVAILABLE',
+    'api.get_job_status': 'JOB_STATUS_NOT_AVAILABLE',
+}
+
+
+@api_bp.before_request
+def _enforce_rate_limit():
+    """Resolve the client IP and apply the per-IP rate limit once per request
+
+    Runs before every handler on the blueprint so the individual endpoints no
+    longer repeat the IP lookup and limiter calls. Only POST endpoints are
+    limited — the cheap GETs (health, job-status polling) were never counted
+    against the budget and polling would exhaust it quickly.
+    """
+    # Health probes short-circuit before any limiter or IP bookkeeping so
+    # load-balancer checks stay microsecond-cheap and out of the keyspace
+    if request.path.endswith('/health'):
+        return None
 
-        # Log the request
-        logger.info(f"Analyzing {len(validated_foods)} foods from IP: {client_ip}")
+    g.client_ip = _client_ip()
 
-        # Analyze the foods using comprehensive nutritional analysis
-        result = food_analyzer.analyze_foods_comprehensive(validated_foods)
+    # Endpoints that depend on the job manager 503 here when it is absent,
+    # replacing the identical availability guard each handler carried
+    unavailable_code = _JOB_MANAGER_ENDPOINTS.get(request.endpoint)
+    if unavailable_code is not None and _get_job_manager() is None:
+        return _error_response(unavailable_code)
 
-        # Update rate limiter
-        rate_limiter.record_request(client_ip)
+    if request.method != 'POST':
+        return None
 
-        # Return successful response
-        return jsonify(result), 200
+    # Reject oversized bodies here; letting werkzeug raise 413 inside a
+    # handler would produce its HTML error page instead of our JSON body
+    max_length = current_app.config['MAX_CONTENT_LENGTH']
+    if max_length and request.content_length and request.content_length > max_length:
+        return _error_response('REQUEST_TOO_LARGE')
 
-    except Exception as e:
-        logger.error(f"Error analyzing foods: {str(e)}", exc_info=True)
-        return jsonify({
-            'error': 'Internal server error. Please try again later.',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    if not rate_limiter.try_consume(g.client_ip):
+        return _error_response('RATE_LIMIT_EXCEEDED')
 
+    return None
 
-@api_bp.route('/health', methods=['GET'])
-def health():
-    """Health check endpoint"""
-    return jsonify({
-        'status': 'healthy',
-        'service': 'food-impact-api',
-        'version': '1.0.0'
-    })
 
+@api_bp.errorhandler(Exception)
+def _handle_unexpected_error(e):
+    """Log any unhandled exception and return the canned JSON 500
 
-@api_bp.route('/recommended-intake', methods=['POST'])
-def get_recommended_intake():
+    One blueprint-level handler replaces the identical try/except wrapper
+    every endpoint used to carry, so the handler bodies stay on the happy
+    path. Deliberate HTTP errors (aborts, method mismatches) pass through
+    to werkzeug untouched.
     """
-    Get recommended daily intake based on nutrients consumed on a given day
-    Expects: {"nutrients_consumed": [{"name": "protein", "total_amount": 75.2, "unit": "grams"}, ...], "age_group": "18-29", "gender": "general"}
-    Returns: {"recommended_intakes": [...], "age_group": "18-29", "gender": "general", "disclaimer": "..."}
-    """
-    try:
-        # Get client IP for rate limiting
-        client_ip = request.remote_addr or request.environ.get('HTTP_X_FORWARDED_FOR', 'unknown')
+    if isinstance(e, HTTPException):
+        return e
+    logger.error("Unhandled error in %s: %s", request.path, e, exc_info=True)
+    return _error_response('INTERNAL_ERROR')
 
-        # Check rate limit
-        if not rate_limiter.is_allowed(client_ip):
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return jsonify({
-                'error': 'Rate limit exceeded. Please try again later.',
-                'code': 'RATE_LIMIT_EXCEEDED'
-            }), 429
 
-        # Get and validate input
-        data = request.get_json()
+def _validate_nutrient_items(nutrients_consumed, skip_invalid=False):
+    """Validate a nutrients_consumed payload in a single pass
 
-        if not data:
-            return jsonify({
-                'error': 'Missing request data',
-                'code': 'MISSING_DATA'
-            }), 400
-
-        # Validate required fields
-        if 'nutrients_consumed' not in data:
-            return jsonify({
-                'error': 'Missing nutrients_consumed field',
-                'code': 'MISSING_NUTRIENTS_CONSUMED'
-            }), 400
-
-        nutrients_consumed = data['nutrients_consumed']
-        if not isinstance(nutrients_consumed, list):
-            return jsonify({
-                'error': 'nutrients_consumed must be an array',
-                'code': 'INVALID_NUTRIENTS_FORMAT'
-            }), 400
+    Returns (validated_nutrients, None) on success, or (None, (response,
+    status)) with the error response the endpoint should return. With
+    skip_invalid=True, items whose amount is missing, non-numeric or zero are
+    dropped instead of rejected (weekly aggregation behavior).
+    """
+    if not isinstance(nutrients_consumed, list):
+        return None, _error_response('INVALID_NUTRIENTS_FORMAT')
 
-        if len(nutrients_consumed) == 0:
-            return jsonify({
-                'error': 'nutrients_consumed array cannot be empty',
-                'code': 'EMPTY_NUTRIENTS_ARRAY'
-            }), 400
+    if len(nutrients_consumed) == 0:
+        return None, _error_response('EMPTY_NUTRIENTS_ARRAY')
 
-        # Validate each nutrient item
-        validated_nutrients = []
-        for i, nutrient in enumerate(nutrients_consumed):
-            if not isinstance(nutrient, dict):
-                return jsonify({
-                    'error': f'Nutrient item at index {i} must be an object',
-                    'code': 'INVALID_NUTRIENT_ITEM'
-                }), 400
-
-            required_fields = ['name', 'total_amount']
-            for field in required_fields:
-                if field not in nutrient:
-                    return jsonify({
-                        'error': f'Missing {field} in nutrient item at index {i}',
-                        'code': 'MISSING_NUTRIENT_FIELD'
-                    }), 400
-
-            # Validate nutrient name (should be a string)
-            if not isinstance(nutrient['name'], str) or not nutrient['name'].strip():
-                return jsonify({
-                    'error': f'Invalid nutrient name at index {i}',
-                    'code': 'INVALID_NUTRIENT_NAME'
-                }), 400
-
-            # Validate total_amount (should be a number)
+    validated_nutrients = []
+    append = validated_nutrients.append
+    for i, nutrient in enumerate(nutrients_consumed):
+        # Skip nutrients with invalid or zero amounts early when filtering
+        if skip_invalid:
             try:
-                total_amount = float(nutrient['total_amount'])
-                if total_amount < 0:
-                    return jsonify({
-                        'error': f'Nutrient amount must be non-negative at index {i}',
-                        'code': 'INVALID_NUTRIENT_AMOUNT'
-                    }), 400
+                if float(nutrient.get('total_amount', 0)) <= 0:
+                    continue
             except (ValueError, TypeError):
-                return jsonify({
-                    'error': f'Invalid nutrient amount at index {i}',
+                continue
+
+        if not isinstance(nutrient, dict):
+            return None, (jsonify({
+                'error': f'Nutrient item at index {i} must be an object',
+                'code': 'INVALID_NUTRIENT_ITEM'
+            }), 400)
+
+        # One subset check on the happy path; name the missing field only on failure
+        if not _NUTRIENT_REQUIRED <= nutrient.keys():
+            missing = 'name' if 'name' not in nutrient else 'total_amount'
+            return None, (jsonify({
+                'error': f'Missing {missing} in nutrient item at index {i}',
+                'code': 'MISSING_NUTRIENT_FIELD'
+            }), 400)
+
+        # Validate nutrient name (should be a string)
+        if not isinstance(nutrient['name'], str) or not nutrient['name'].strip():
+            return None, (jsonify({
+                'error': f'Invalid nutrient name at index {i}',
+                'code': 'INVALID_NUTRIENT_NAME'
+            }), 400)
+
+        # Validate total_amount (should be a number)
+        try:
+            total_amount = float(nutrient['total_amount'])
+            if total_amount < 0:
+                return None, (jsonify({
+                    'error': f'Nutrient amount must be non-negative at index {i}',
                     'code': 'INVALID_NUTRIENT_AMOUNT'
-                }), 400
+                }), 400)
+        except (ValueError, TypeError):
+            return None, (jsonify({
+                'error': f'Invalid nutrient amount at index {i}',
+                'code': 'INVALID_NUTRIENT_AMOUNT'
+            }), 400)
+
+        # Validate unit (optional, defaults to "grams")
+        unit = nutrient.get('unit', 'grams')
+        if not isinstance(unit, str):
+            unit = 'grams'
+
+        append({
+            'name': nutrient['name'].strip(),
+            'total_amount': total_amount,
+            'unit': unit
+        })
+
+    return validated_nutrients, None
+
+
+def _parse_intake_request(data, skip_invalid=False):
+    """Validate a complete recommended-intake payload
+
+    Wraps _validate_nutrient_items and the age_group/gender checks shared by
+    the daily, async and weekly intake endpoints. Returns
+    ((validated_nutrients, age_group, gender), None) on success, or
+    (None, error_response).
+    """
+    if not data:
+        return None, _error_response('MISSING_DATA')
 
-            # Validate unit (optional, defaults to "grams")
-            unit = nutrient.get('unit', 'grams')
-            if not isinstance(unit, str):
-                unit = 'grams'
+    if 'nutrients_consumed' not in data:
+        return None, _error_response('MISSING_NUTRIENTS_CONSUMED')
 
-            validated_nutrients.append({
-                'name': nutrient['name'].strip(),
-                'total_amount': total_amount,
-                'unit': unit
-            })
+    validated_nutrients, error = _validate_nutrient_items(
+        data['nutrients_consumed'], skip_invalid=skip_invalid)
+    if error:
+        return None, error
 
-        # Get optional parameters
-        age_group = data.get('age_group', '18-29')
-        gender = data.get('gender', 'general')
+    age_group = data.get('age_group', '18-29')
+    gender = data.get('gender', 'general')
 
-        # Validate age_group and gender
-        valid_age_groups = ['0-18', '19-40', '18-29', '>40']
-        if age_group not in valid_age_groups:
-            return jsonify({
-                'error': f'Invalid age_group. Must be one of: {", ".join(valid_age_groups)}',
-                'code': 'INVALID_AGE_GROUP'
-            }), 400
+    if age_group not in _VALID_AGE_GROUPS:
+        return None, _error_response('INVALID_AGE_GROUP')
 
-        valid_genders = ['male', 'female', 'general']
-        if gender not in valid_genders:
-            return jsonify({
-                'error': f'Invalid gender. Must be one of: {", ".join(valid_genders)}',
-                'code': 'INVALID_GENDER'
-            }), 400
+    if gender not in _VALID_GENDERS:
+        return None, _error_response('INVALID_GENDER')
 
-        # Log the request
-        logger.info(f"Getting recommended intake for {len(validated_nutrients)} nutrients from IP: {client_ip}")
+    return (validated_nutrients, age_group, gender), None
 
-        # Get recommended intake using AI analysis
-        result = food_analyzer.get_recommended_intake(validated_nutrients, age_group, gender)
 
-        # Update rate limiter
-        rate_limiter.record_request(client_ip)
+def _validate_food_items(data):
+    """Validate a food-analysis payload in a single pass
 
-        # Return successful response
-        return jsonify(result), 200
+    Returns (validated_foods, None) on success, or (None, (response, status))
+    with the error response the endpoint should return.
+    """
+    if not data:
+        return None, _error_response('MISSING_DATA')
+
+    # Expect an array of food objects
+    if not isinstance(data, list):
+        return None, _error_response('INVALID_INPUT_FORMAT')
+
+    if len(data) == 0:
+        return None, _error_response('EMPTY_FOOD_ARRAY')
+
+    if len(data) > _MAX_FOOD_ITEMS:
+        return None, _error_response('TOO_MANY_FOOD_ITEMS')
+
+    # Validate each food item
+    validated_foods = []
+    for i, food_item in enumerate(data):
+        if not isinstance(food_item, dict):
+            return None, (jsonify({
+                'error': f'Food item at index {i} must be an object',
+                'code': 'INVALID_FOOD_ITEM'
+            }), 400)
+
+        # One hash probe per field instead of a membership test plus a lookup
+        food_name = food_item.get('food_name')
+        if food_name is None:
+            return None, (jsonify({
+                'error': f'Missing food_name in food item at index {i}',
+                'code': 'MISSING_FOOD_NAME'
+            }), 400)
+
+        meal_type = food_item.get('meal_type')
+        if meal_type is None:
+            return None, (jsonify({
+                'error': f'Missing meal_type in food item at index {i}',
+                'code': 'MISSING_MEAL_TYPE'
+            }), 400)
+
+        food_name = food_name.strip()
+        meal_type = meal_type.strip()
+
+        # Validate food name
+        validation_result = validate_food_name(food_name)
+        if not validation_result['valid']:
+            return None, (jsonify({
+                'error': f'Invalid food_name at index {i}: {validation_result["error"]}',
+                'code': 'INVALID_FOOD_NAME'
+            }), 400)
+
+        # Validate meal type
+        if meal_type not in _VALID_MEAL_TYPES:
+            return None, (jsonify({
+                'error': f'Invalid meal_type at index {i}. Must be one of: {_VALID_MEAL_TYPES_STR}',
+                'code': 'INVALID_MEAL_TYPE'
+            }), 400)
+
+        # Reuse the parsed dict instead of allocating a fresh one per item;
+        # only rebuild when the client sent extra keys we must not pass along
+        if len(food_item) == 2:
+            food_item['food_name'] = food_name
+            food_item['meal_type'] = meal_type
+            validated_foods.append(food_item)
+        else:
+            validated_foods.append({
+                'food_name': food_name,
+                'meal_type': meal_type
+            })
 
-    except Exception as e:
-        logger.error(f"Error getting recommended intake: {str(e)}", exc_info=True)
-        return jsonify({
-            'error': 'Internal server error. Please try again later.',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    return validated_foods, None
 
 
-@api_bp.route('/recommended-intake-async', methods=['POST'])
-def get_recommended_intake_async():
+@api_bp.route('/analyze-food', methods=['POST'])
+def analyze_food():
     """
-    Start asynchronous recommended intake analysis job
-    Expects: {"nutrients_consumed": [{"name": "protein", "total_amount": 75.2, "unit": "grams"}, ...], "age_group": "18-29", "gender": "general"}
-    Returns: {"job_id": "string", "status": "queued", "message": "Job queued for processing"}
+    Analyze food impact endpoint using comprehensive nutritional analysis
+    Expects: [{"food_name": "string", "meal_type": "breakfast|lunch|dinner|snack"}, ...]
+    Returns: [{"food_name": "string", "meal_type": "string", "serving": {...}, "ingredients": [...], "nutrients_g": {...}}]
     """
-    try:
-        # Get client IP for rate limiting
-        client_ip = request.remote_addr or request.environ.get('HTTP_X_FORWARDED_FOR', 'unknown')
-
-        # Check rate limit
-        if not rate_limiter.is_allowed(client_ip):
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return jsonify({
-                'error': 'Rate limit exceeded. Please try again later.',
-                'code': 'RATE_LIMIT_EXCEEDED'
-            }), 429
-
-        if not job_manager:
-            return jsonify({
-                'error': 'Asynchronous processing not available',
-                'code': 'ASYNC_NOT_AVAILABLE'
-            }), 503
-
-        # Get and validate input
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                'error': 'Missing request data',
-                'code': 'MISSING_DATA'
-            }), 400
-
-        # Validate required fields
-        if 'nutrients_consumed' not in data:
-            return jsonify({
-                'error': 'Missing nutrients_consumed field',
-                'code': 'MISSING_NUTRIENTS_CONSUMED'
-            }), 400
-
-        nutrients_consumed = data['nutrients_consumed']
-        if not isinstance(nutrients_consumed, list):
-            return jsonify({
-                'error': 'nutrients_consumed must be an array',
-                'code': 'INVALID_NUTRIENTS_FORMAT'
-            }), 400
+    # Get and validate input
+    validated_foods, error = _validate_food_items(_get_request_json())
+    if error:
+        return error
+
+    # Serve a recent identical request straight from cache
+    cache_key = tuple(
+        (food['food_name'].casefold(), food['meal_type'])
+        for food in validated_foods
+    )
+    with _analyze_cache_lock:
+        result = _analyze_cache.get(cache_key)
+    if result is not None:
+        # The key is casefolded but the stored entries echo whatever casing
+        # the original requester sent; patch the identity fields so clients
+        # get back exactly the names they posted, as the dedupe path does
+        result = [
+            analysis if (analysis.get('food_name') == food['food_name']
+                         and analysis.get('meal_type') == food['meal_type'])
+            else {**analysis,
+                  'food_name': food['food_name'],
+                  'meal_type': food['meal_type']}
+            for food, analysis in zip(validated_foods, result)
+        ]
+        return current_app.response_class(
+            _stream_json_array(result), mimetype='application/json')
+
+    # Log the request
+    logger.info("Analyzing %d foods from IP: %s", len(validated_foods), g.client_ip)
+
+    # Analyze each distinct dish once; duplicate names reuse the analysis
+    unique_index = {}
+    unique_foods = []
+    for food in validated_foods:
+        name_key = food['food_name'].casefold()
+        if name_key not in unique_index:
+            unique_index[name_key] = len(unique_foods)
+            unique_foods.append(food)
+
+    if len(unique_foods) == len(validated_foods):
+        result = _get_food_analyzer().analyze_foods_comprehensive(validated_foods)
+    else:
+        unique_results = _get_food_analyzer().analyze_foods_comprehensive(unique_foods)
+        result = []
+        for food in validated_foods:
+            analysis = unique_results[unique_index[food['food_name'].casefold()]]
+            if (analysis.get('food_name') != food['food_name']
+                    or analysis.get('meal_type') != food['meal_type']):
+                # Shallow copy is enough: only the top-level identity
+                # fields differ between duplicates
+                analysis = {**analysis,
+                            'food_name': food['food_name'],
+                            'meal_type': food['meal_type']}
+            result.append(analysis)
+
+    with _analyze_cache_lock:
+        _analyze_cache[cache_key] = result
+
+    # Stream the array back one analyzed food at a time
+    return current_app.response_class(
+        _stream_json_array(result), mimetype='application/json')
+
+
+# Health payload never changes, so serialize it once at import time
+_HEALTH_BODY = orjson.dumps({
+    'status': 'healthy',
+    'service': 'food-impact-api',
+    'version': '1.0.0'
+})
 
-        if len(nutrients_consumed) == 0:
-            return jsonify({
-                'error': 'nutrients_consumed array cannot be empty',
-                'code': 'EMPTY_NUTRIENTS_ARRAY'
-            }), 400
 
-        # Validate each nutrient item
-        validated_nutrients = []
-        for i, nutrient in enumerate(nutrients_consumed):
-            if not isinstance(nutrient, dict):
-                return jsonify({
-                    'error': f'Nutrient item at index {i} must be an object',
-                    'code': 'INVALID_NUTRIENT_ITEM'
-                }), 400
-
-            required_fields = ['name', 'total_amount']
-            for field in required_fields:
-                if field not in nutrient:
-                    return jsonify({
-                        'error': f'Missing {field} in nutrient item at index {i}',
-                        'code': 'MISSING_NUTRIENT_FIELD'
-                    }), 400
-
-            # Validate nutrient name (should be a string)
-            if not isinstance(nutrient['name'], str) or not nutrient['name'].strip():
-                return jsonify({
-                    'error': f'Invalid nutrient name at index {i}',
-                    'code': 'INVALID_NUTRIENT_NAME'
-                }), 400
-
-            # Validate total_amount (should be a number)
-            try:
-                total_amount = float(nutrient['total_amount'])
-                if total_amount < 0:
-                    return jsonify({
-                        'error': f'Nutrient amount must be non-negative at index {i}',
-                        'code': 'INVALID_NUTRIENT_AMOUNT'
-                    }), 400
-            except (ValueError, TypeError):
-                return jsonify({
-                    'error': f'Invalid nutrient amount at index {i}',
-                    'code': 'INVALID_NUTRIENT_AMOUNT'
-                }), 400
+@api_bp.route('/health', methods=['GET'])
+def health():
+    """Health check endpoint"""
+    return current_app.response_class(_HEALTH_BODY, mimetype='application/json')
 
-            # Validate unit (optional, defaults to "grams")
-            unit = nutrient.get('unit', 'grams')
-            if not isinstance(unit, str):
-                unit = 'grams'
 
-            validated_nutrients.append({
-                'name': nutrient['name'].strip(),
-                'total_amount': total_amount,
-                'unit': unit
-            })
+@api_bp.route('/recommended-intake', methods=['POST'])
+def get_recommended_intake():
+    """
+    Get recommended daily intake based on nutrients consumed on a given day
+    Expects: {"nutrients_consumed": [{"name": "protein", "total_amount": 75.2, "unit": "grams"}, ...], "age_group": "18-29", "gender": "general"}
+    Returns: {"recommended_intakes": [...], "age_group": "18-29", "gender": "general", "disclaimer": "..."}
+    """
+    # Get and validate input
+    parsed, error = _parse_intake_request(_get_request_json())
+    if error:
+        return error
+    validated_nutrients, age_group, gender = parsed
 
-        # Get optional parameters
-        age_group = data.get('age_group', '18-29')
-        gender = data.get('gender', 'general')
+    # Log the request
+    logger.info("Getting recommended intake for %d nutrients from IP: %s", len(validated_nutrients), g.client_ip)
 
-        # Validate age_group and gender
-        valid_age_groups = ['0-18', '19-40', '18-29', '>40']
-        if age_group not in valid_age_groups:
-            return jsonify({
-                'error': f'Invalid age_group. Must be one of: {", ".join(valid_age_groups)}',
-                'code': 'INVALID_AGE_GROUP'
-            }), 400
+    # Get recommended intake using AI analysis (cached for repeat inputs)
+    result = _cached_recommendation(
+        _intake_cache_key('daily', validated_nutrients, age_group, gender),
+        lambda: _get_food_analyzer().get_recommended_intake(validated_nutrients, age_group, gender))
 
-        valid_genders = ['male', 'female', 'general']
-        if gender not in valid_genders:
-            return jsonify({
-                'error': f'Invalid gender. Must be one of: {", ".join(valid_genders)}',
-                'code': 'INVALID_GENDER'
-            }), 400
+    # Return successful response
+    return _json_response(result)
 
-        # Log the request
-        logger.info(f"Creating async job for recommended intake analysis of {len(validated_nutrients)} nutrients from IP: {client_ip}")
-
-        # Create async job with proper job_data structure
-        job_data = {
-            'job_type': 'recommended_intake',
-            'nutrients_consumed': validated_nutrients,
-            'age_group': age_group,
-            'gender': gender
-        }
-        job_id = job_manager.create_job(job_data)
-
-        # Update rate limiter
-        rate_limiter.record_request(client_ip)
-
-        # Return job ID immediately
-        return jsonify({
-            'job_id': job_id,
-            'status': 'queued',
-            'message': 'Job queued for processing. Use /job-status/{job_id} to check progress.',
-            'estimated_time': '30-60 seconds'
-        }), 202
 
-    except Exception as e:
-        logger.error(f"Error creating async recommended intake job: {str(e)}", exc_info=True)
-        return jsonify({
-            'error': 'Internal server error. Please try again later.',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+@api_bp.route('/recommended-intake-async', methods=['POST'])
+def get_recommended_intake_async():
+    """
+    Start asynchronous recommended intake analysis job
+    Expects: {"nutrients_consumed": [{"name": "protein", "total_amount": 75.2, "unit": "grams"}, ...], "age_group": "18-29", "gender": "general"}
+    Returns: {"job_id": "string", "status": "queued", "message": "Job queued for processing"}
+    """
+    # Replay a retried request before re-validating or queueing anything
+    idem_key, replay = _idempotent_replay()
+    if replay is not None:
+        return replay
+
+    # Get and validate input
+    parsed, error = _parse_intake_request(_get_request_json())
+    if error:
+        return error
+    validated_nutrients, age_group, gender = parsed
+
+    # Log the request
+    logger.info("Creating async job for recommended intake analysis of %d nutrients from IP: %s", len(validated_nutrients), g.client_ip)
+
+    # Create async job with proper job_data structure
+    job_data = {
+        'job_type': 'recommended_intake',
+        'nutrients_consumed': validated_nutrients,
+        'age_group': age_group,
+        'gender': gender
+    }
+    job_id = _get_job_manager().create_job(job_data)
+
+    # Return job ID immediately
+    return _async_accepted(idem_key, {
+        'job_id': job_id,
+        'status': 'queued',
+        'message': 'Job queued for processing. Use /job-status/{job_id} to check progress.',
+        'estimated_time': '30-60 seconds'
+    })
 
 
 @api_bp.route('/recommended-intake-for-week', methods=['POST'])
@@ -446,148 +622,26 @@ def get_weekly_recommended_intake():
     Expects: {"nutrients_consumed": [{"name": "protein", "total_amount": 75.2, "unit": "grams"}, ...], "age_group": "18-29", "gender": "general"}
     Returns: {"recommended_intakes": {...}, "age_group": "18-29", "gender": "general", "disclaimer": "..."}
     """
-    try:
-        # Get client IP for rate limiting
-        client_ip = request.remote_addr or request.environ.get('HTTP_X_FORWARDED_FOR', 'unknown')
-
-        # Check rate limit
-        if not rate_limiter.is_allowed(client_ip):
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return jsonify({
-                'error': 'Rate limit exceeded. Please try again later.',
-                'code': 'RATE_LIMIT_EXCEEDED'
-            }), 429
-
-        # Get and validate input
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                'error': 'Missing request data',
-                'code': 'MISSING_DATA'
-            }), 400
+    # Get and validate input, filtering out invalid nutrient amounts
+    parsed, error = _parse_intake_request(_get_request_json(), skip_invalid=True)
+    if error:
+        return error
+    validated_nutrients, age_group, gender = parsed
 
-        # Validate required fields
-        if 'nutrients_consumed' not in data:
-            return jsonify({
-                'error': 'Missing nutrients_consumed field',
-                'code': 'MISSING_NUTRIENTS_CONSUMED'
-            }), 400
+    # Check if we have any valid nutrients after filtering
+    if len(validated_nutrients) == 0:
+        return _error_response('NO_VALID_NUTRIENTS')
 
-        nutrients_consumed = data['nutrients_consumed']
-        if not isinstance(nutrients_consumed, list):
-            return jsonify({
-                'error': 'nutrients_consumed must be an array',
-                'code': 'INVALID_NUTRIENTS_FORMAT'
-            }), 400
+    # Log the request
+    logger.info("Getting weekly recommended intake for %d nutrients from IP: %s", len(validated_nutrients), g.client_ip)
 
-        if len(nutrients_consumed) == 0:
-            return jsonify({
-                'error': 'nutrients_consumed array cannot be empty',
-                'code': 'EMPTY_NUTRIENTS_ARRAY'
-            }), 400
+    # Get weekly recommended intake using AI analysis (cached for repeat inputs)
+    result = _cached_recommendation(
+        _intake_cache_key('weekly', validated_nutrients, age_group, gender),
+        lambda: _get_food_analyzer().get_weekly_recommended_intake(validated_nutrients, age_group, gender))
 
-        # Validate each nutrient item and filter out invalid ones
-        validated_nutrients = []
-        for i, nutrient in enumerate(nutrients_consumed):
-            # Skip nutrients with invalid or zero amounts early
-            try:
-                amount = float(nutrient.get('total_amount', 0))
-                if amount <= 0:
-                    continue
-            except (ValueError, TypeError):
-                continue
-
-            if not isinstance(nutrient, dict):
-                return jsonify({
-                    'error': f'Nutrient item at index {i} must be an object',
-                    'code': 'INVALID_NUTRIENT_ITEM'
-                }), 400
-
-            required_fields = ['name', 'total_amount']
-            for field in required_fields:
-                if field not in nutrient:
-                    return jsonify({
-                        'error': f'Missing {field} in nutrient item at index {i}',
-                        'code': 'MISSING_NUTRIENT_FIELD'
-                    }), 400
-
-            # Validate nutrient name (should be a string)
-            if not isinstance(nutrient['name'], str) or not nutrient['name'].strip():
-                return jsonify({
-                    'error': f'Invalid nutrient name at index {i}',
-                    'code': 'INVALID_NUTRIENT_NAME'
-                }), 400
-
-            # Validate total_amount (should be a number)
-            try:
-                total_amount = float(nutrient['total_amount'])
-                if total_amount < 0:
-                    return jsonify({
-                        'error': f'Nutrient amount must be non-negative at index {i}',
-                        'code': 'INVALID_NUTRIENT_AMOUNT'
-                    }), 400
-            except (ValueError, TypeError):
-                return jsonify({
-                    'error': f'Invalid nutrient amount at index {i}',
-                    'code': 'INVALID_NUTRIENT_AMOUNT'
-                }), 400
-
-            # Validate unit (optional, defaults to "grams")
-            unit = nutrient.get('unit', 'grams')
-            if not isinstance(unit, str):
-                unit = 'grams'
-
-            validated_nutrients.append({
-                'name': nutrient['name'].strip(),
-                'total_amount': total_amount,
-                'unit': unit
-            })
-
-        # Get optional parameters
-        age_group = data.get('age_group', '18-29')
-        gender = data.get('gender', 'general')
-
-        # Validate age_group and gender
-        valid_age_groups = ['0-18', '19-40', '18-29', '>40']
-        if age_group not in valid_age_groups:
-            return jsonify({
-                'error': f'Invalid age_group. Must be one of: {", ".join(valid_age_groups)}',
-                'code': 'INVALID_AGE_GROUP'
-            }), 400
-
-        valid_genders = ['male', 'female', 'general']
-        if gender not in valid_genders:
-            return jsonify({
-                'error': f'Invalid gender. Must be one of: {", ".join(valid_genders)}',
-                'code': 'INVALID_GENDER'
-            }), 400
-
-        # Check if we have any valid nutrients after filtering
-        if len(validated_nutrients) == 0:
-            return jsonify({
-                'error': 'No valid nutrients found in the request. All nutrients were filtered out due to invalid or zero amounts.',
-                'code': 'NO_VALID_NUTRIENTS'
-            }), 400
-
-        # Log the request
-        logger.info(f"Getting weekly recommended intake for {len(validated_nutrients)} nutrients from IP: {client_ip}")
-
-        # Get weekly recommended intake using AI analysis
-        result = food_analyzer.get_weekly_recommended_intake(validated_nutrients, age_group, gender)
-
-        # Update rate limiter
-        rate_limiter.record_request(client_ip)
-
-        # Return successful response
-        return jsonify(result), 200
-
-    except Exception as e:
-        logger.error(f"Error getting weekly recommended intake: {str(e)}", exc_info=True)
-        return jsonify({
-            'error': 'Internal server error. Please try again later.',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    # Return successful response
+    return _json_response(result)
 
 
 @api_bp.route('/neutralization-recommendations', methods=['POST'])
@@ -597,75 +651,43 @@ def get_neutralization_recommendations():
     Expects: {"overdosed_substances": ["sodium", "sugar", ...]}
     Returns: {"success": true, "recommendations": {...}, "overdosed_substances": [...], "disclaimer": "..."}
     """
-    try:
-        # Get client IP for rate limiting
-        client_ip = request.remote_addr or request.environ.get('HTTP_X_FORWARDED_FOR', 'unknown')
-
-        # Check rate limit
-        if not rate_limiter.is_allowed(client_ip):
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return jsonify({
-                'error': 'Rate limit exceeded. Please try again later.',
-                'code': 'RATE_LIMIT_EXCEEDED'
-            }), 429
+    # Get and validate input
+    data = _get_request_json()
 
-        # Get and validate input
-        data = request.get_json()
+    if not data:
+        return _error_response('MISSING_DATA')
 
-        if not data:
-            return jsonify({
-                'error': 'Missing request data',
-                'code': 'MISSING_DATA'
-            }), 400
+    # Validate required fields
+    if 'overdosed_substances' not in data:
+        return _error_response('MISSING_OVERDOSED_SUBSTANCES')
 
-        # Validate required fields
-        if 'overdosed_substances' not in data:
-            return jsonify({
-                'error': 'Missing overdosed_substances field',
-                'code': 'MISSING_OVERDOSED_SUBSTANCES'
-            }), 400
+    overdosed_substances = data['overdosed_substances']
+    if not isinstance(overdosed_substances, list):
+        return _error_response('INVALID_OVERDOSED_SUBSTANCES_FORMAT')
 
-        overdosed_substances = data['overdosed_substances']
-        if not isinstance(overdosed_substances, list):
-            return jsonify({
-                'error': 'overdosed_substances must be an array',
-                'code': 'INVALID_OVERDOSED_SUBSTANCES_FORMAT'
-            }), 400
+    if len(overdosed_substances) == 0:
+        return _error_response('EMPTY_OVERDOSED_SUBSTANCES_ARRAY')
 
-        if len(overdosed_substances) == 0:
+    # Validate each substance (should be a non-empty string)
+    validated_substances = []
+    for i, substance in enumerate(overdosed_substances):
+        if not isinstance(substance, str) or not substance.strip():
             return jsonify({
-                'error': 'overdosed_substances array cannot be empty',
-                'code': 'EMPTY_OVERDOSED_SUBSTANCES_ARRAY'
+                'error': f'Invalid substance name at index {i}',
+                'code': 'INVALID_SUBSTANCE_NAME'
             }), 400
+        validated_substances.append(substance.strip())
 
-        # Validate each substance (should be a non-empty string)
-        validated_substances = []
-        for i, substance in enumerate(overdosed_substances):
-            if not isinstance(substance, str) or not substance.strip():
-                return jsonify({
-                    'error': f'Invalid substance name at index {i}',
-                    'code': 'INVALID_SUBSTANCE_NAME'
-                }), 400
-            validated_substances.append(substance.strip())
-
-        # Log the request
-        logger.info(f"Getting neutralization recommendations for {len(validated_substances)} substances from IP: {client_ip}")
+    # Log the request
+    logger.info("Getting neutralization recommendations for %d substances from IP: %s", len(validated_substances), g.client_ip)
 
-        # Get neutralization recommendations using AI analysis
-        result = food_analyzer.get_neutralization_recommendations(validated_substances)
+    # Get neutralization recommendations using AI analysis (cached for repeat inputs)
+    result = _cached_recommendation(
+        ('neutralize', tuple(sorted(sub.casefold() for sub in validated_substances))),
+        lambda: _get_food_analyzer().get_neutralization_recommendations(validated_substances))
 
-        # Update rate limiter
-        rate_limiter.record_request(client_ip)
-
-        # Return successful response
-        return jsonify(result), 200
-
-    except Exception as e:
-        logger.error(f"Error getting neutralization recommendations: {str(e)}", exc_info=True)
-        return jsonify({
-            'error': 'Internal server error. Please try again later.',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    # Return successful response
+    return _json_response(result)
 
 
 @api_bp.route('/neutralization-recommendations-async', methods=['POST'])
@@ -675,90 +697,55 @@ def get_neutralization_recommendations_async():
     Expects: {"overdosed_substances": ["sodium", "sugar", ...]}
     Returns: {"job_id": "string", "status": "queued", "message": "Job queued for processing"}
     """
-    try:
-        # Get client IP for rate limiting
-        client_ip = request.remote_addr or request.environ.get('HTTP_X_FORWARDED_FOR', 'unknown')
-
-        # Check rate limit
-        if not rate_limiter.is_allowed(client_ip):
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return jsonify({
-                'error': 'Rate limit exceeded. Please try again later.',
-                'code': 'RATE_LIMIT_EXCEEDED'
-            }), 429
-
-        if not job_manager:
-            return jsonify({
-                'error': 'Asynchronous processing not available',
-                'code': 'ASYNC_NOT_AVAILABLE'
-            }), 503
-
-        # Get and validate input
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                'error': 'Missing request data',
-                'code': 'MISSING_DATA'
-            }), 400
-
-        # Validate required fields
-        if 'overdosed_substances' not in data:
-            return jsonify({
-                'error': 'Missing overdosed_substances field',
-                'code': 'MISSING_OVERDOSED_SUBSTANCES'
-            }), 400
-
-        overdosed_substances = data['overdosed_substances']
-        if not isinstance(overdosed_substances, list):
-            return jsonify({
-                'error': 'overdosed_substances must be an array',
-                'code': 'INVALID_OVERDOSED_SUBSTANCES_FORMAT'
-            }), 400
-
-        if len(overdosed_substances) == 0:
-            return jsonify({
-                'error': 'overdosed_substances array cannot be empty',
-                'code': 'EMPTY_OVERDOSED_SUBSTANCES_ARRAY'
-            }), 400
-
-        # Validate each substance (should be a non-empty string)
-        validated_substances = []
-        for i, substance in enumerate(overdosed_substances):
-            if not isinstance(substance, str) or not substance.strip():
-                return jsonify({
-                    'error': f'Invalid substance name at index {i}',
-                    'code': 'INVALID_SUBSTANCE_NAME'
-                }), 400
-            validated_substances.append(substance.strip())
-
-        # Log the request
-        logger.info(f"Creating async neutralization recommendations job for {len(validated_substances)} substances from IP: {client_ip}")
-
-        # Create async job with job type
-        job_data = {
-            'job_type': 'neutralization_recommendations',
-            'overdosed_substances': validated_substances
-        }
-        job_id = job_manager.create_job(job_data)
-
-        # Update rate limiter
-        rate_limiter.record_request(client_ip)
-
-        # Return job ID immediately
-        return jsonify({
-            'job_id': job_id,
-            'status': 'queued',
-            'message': 'Job queued for processing. Use /job-status/{job_id} to check progress.',
-            'estimated_time': '30-60 seconds'
-        }), 202
-
-    except Exception as e:
-        logger.error(f"Error creating async neutralization recommendations job: {str(e)}", exc_info=True)
-        return jsonify({
-            'error': 'Internal server error. Please try again later.',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    # Replay a retried request before re-validating or queueing anything
+    idem_key, replay = _idempotent_replay()
+    if replay is not None:
+        return replay
+
+    # Get and validate input
+    data = _get_request_json()
+
+    if not data:
+        return _error_response('MISSING_DATA')
+
+    # Validate required fields
+    if 'overdosed_substances' not in data:
+        return _error_response('MISSING_OVERDOSED_SUBSTANCES')
+
+    overdosed_substances = data['overdosed_substances']
+    if not isinstance(overdosed_substances, list):
+        return _error_response('INVALID_OVERDOSED_SUBSTANCES_FORMAT')
+
+    if len(overdosed_substances) == 0:
+        return _error_response('EMPTY_OVERDOSED_SUBSTANCES_ARRAY')
+
+    # Validate each substance (should be a non-empty string)
+    validated_substances = []
+    for i, substance in enumerate(overdosed_substances):
+        if not isinstance(substance, str) or not substance.strip():
+            return jsonify({
+                'error': f'Invalid substance name at index {i}',
+                'code': 'INVALID_SUBSTANCE_NAME'
+            }), 400
+        validated_substances.append(substance.strip())
+
+    # Log the request
+    logger.info("Creating async neutralization recommendations job for %d substances from IP: %s", len(validated_substances), g.client_ip)
+
+    # Create async job with job type
+    job_data = {
+        'job_type': 'neutralization_recommendations',
+        'overdosed_substances': validated_substances
+    }
+    job_id = _get_job_manager().create_job(job_data)
+
+    # Return job ID immediately
+    return _async_accepted(idem_key, {
+        'job_id': job_id,
+        'status': 'queued',
+        'message': 'Job queued for processing. Use /job-status/{job_id} to check progress.',
+        'estimated_time': '30-60 seconds'
+    })
 
 
 @api_bp.route('/analyze-food-async', methods=['POST'])
@@ -768,118 +755,52 @@ def analyze_food_async():
     Expects: [{"food_name": "string", "meal_type": "breakfast|lunch|dinner|snack"}, ...]
     Returns: {"job_id": "string", "status": "queued", "message": "Job queued for processing"}
     """
-    try:
-        # Get client IP for rate limiting
-        client_ip = request.remote_addr or request.environ.get('HTTP_X_FORWARDED_FOR', 'unknown')
-
-        # Check rate limit
-        if not rate_limiter.is_allowed(client_ip):
-            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
-            return jsonify({
-                'error': 'Rate limit exceeded. Please try again later.',
-                'code': 'RATE_LIMIT_EXCEEDED'
-            }), 429
-
-        if not job_manager:
-            return jsonify({
-                'error': 'Asynchronous processing not available',
-                'code': 'ASYNC_NOT_AVAILABLE'
-            }), 503
-
-        # Get and validate input
-        data = request.get_json()
-
-        if not data:
-            return jsonify({
-                'error': 'Missing request data',
-                'code': 'MISSING_DATA'
-            }), 400
-
-        # Expect an array of food objects
-        if not isinstance(data, list):
-            return jsonify({
-                'error': 'Input must be an array of food objects',
-                'code': 'INVALID_INPUT_FORMAT'
-            }), 400
-
-        if len(data) == 0:
-            return jsonify({
-                'error': 'Food array cannot be empty',
-                'code': 'EMPTY_FOOD_ARRAY'
-            }), 400
-
-        # Validate each food item
-        validated_foods = []
-        for i, food_item in enumerate(data):
-            if not isinstance(food_item, dict):
-                return jsonify({
-                    'error': f'Food item at index {i} must be an object',
-                    'code': 'INVALID_FOOD_ITEM'
-                }), 400
-
-            if 'food_name' not in food_item:
-                return jsonify({
-                    'error': f'Missing food_name in food item at index {i}',
-                    'code': 'MISSING_FOOD_NAME'
-                }), 400
-
-            if 'meal_type' not in food_item:
-                return jsonify({
-                    'error': f'Missing meal_type in food item at index {i}',
-                    'code': 'MISSING_MEAL_TYPE'
-                }), 400
-
-            food_name = food_item['food_name'].strip()
-            meal_type = food_item['meal_type'].strip()
-
-            # Validate food name
-            validation_result = validate_food_name(food_name)
-            if not validation_result['valid']:
-                return jsonify({
-                    'error': f'Invalid food_name at index {i}: {validation_result["error"]}',
-                    'code': 'INVALID_FOOD_NAME'
-                }), 400
-
-            # Validate meal type
-            valid_meal_types = ['breakfast', 'lunch', 'dinner', 'snack']
-            if meal_type not in valid_meal_types:
-                return jsonify({
-                    'error': f'Invalid meal_type at index {i}. Must be one of: {", ".join(valid_meal_types)}',
-                    'code': 'INVALID_MEAL_TYPE'
-                }), 400
-
-            validated_foods.append({
-                'food_name': food_name,
-                'meal_type': meal_type
-            })
+    # Replay a retried request before re-validating or queueing anything
+    idem_key, replay = _idempotent_replay()
+    if replay is not None:
+        return replay
+
+    # Get and validate input through the same single-pass helper as the
+    # synchronous endpoint
+    validated_foods, error = _validate_food_items(_get_request_json())
+    if error:
+        return error
+
+    # Log the request
+    logger.info("Creating async job for %d foods from IP: %s", len(validated_foods), g.client_ip)
+
+    # Create async job with proper job_data structure
+    job_data = {
+        'job_type': 'food_analysis',
+        'foods': validated_foods
+    }
+    job_id = _get_job_manager().create_job(job_data)
+
+    # Return job ID immediately
+    return _async_accepted(idem_key, {
+        'job_id': job_id,
+        'status': 'queued',
+        'message': 'Job queued for processing. Use /job-status/{job_id} to check progress.',
+        'estimated_time': '30-60 seconds'
+    })
 
-        # Log the request
-        logger.info(f"Creating async job for {len(validated_foods)} foods from IP: {client_ip}")
 
-        # Create async job with proper job_data structure
-        job_data = {
-            'job_type': 'food_analysis',
-            'foods': validated_foods
-        }
-        job_id = job_manager.create_job(job_data)
+# Response fields a client may request via ?fields= on job-status; job_id is
+# always included so pollers can correlate responses
+_JOB_STATUS_FIELDS = frozenset(('status', 'created_at', 'updated_at', 'result', 'error'))
 
-        # Update rate limiter
-        rate_limiter.record_request(client_ip)
 
-        # Return job ID immediately
-        return jsonify({
-            'job_id': job_id,
-            'status': 'queued',
-            'message': 'Job queued for processing. Use /job-status/{job_id} to check progress.',
-            'estimated_time': '30-60 seconds'
-        }), 202
+def _job_status_stream(envelope, result):
+    """Yield a completed job-status body with the result as its own chunk
 
-    except Exception as e:
-        logger.error(f"Error creating async food analysis job: {str(e)}", exc_info=True)
-        return jsonify({
-            'error': 'Internal server error. Please try again later.',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    The envelope is serialized without its closing brace, then the result —
+    the part that can run to megabytes — is emitted as a separate chunk, so
+    peak memory tracks the largest piece rather than the whole body.
+    """
+    yield orjson.dumps(envelope)[:-1]
+    yield b',"result":'
+    yield orjson.dumps(result, default=_json_default)
+    yield b'}'
 
 
 @api_bp.route('/job-status/<job_id>', methods=['GET'])
@@ -887,40 +808,51 @@ def get_job_status(job_id):
     """
     Get the status of an asynchronous job
     Returns: {"job_id": "string", "status": "queued|processing|completed|failed", "result": {...}, "error": "string"}
-    """
-    try:
-        if not job_manager:
-            return jsonify({
-                'error': 'Job status checking not available',
-                'code': 'JOB_STATUS_NOT_AVAILABLE'
-            }), 503
-
-        job = job_manager.get_job_status(job_id)
-
-        if not job:
-            return jsonify({
-                'error': 'Job not found',
-                'code': 'JOB_NOT_FOUND'
-            }), 404
 
-        # Return job status
-        response = {
-            'job_id': job['job_id'],
-            'status': job['status'],
-            'created_at': job.get('created_at'),
-            'updated_at': job.get('updated_at')
-        }
+    Accepts ?fields=status,updated_at,... (CSV, whitelisted) so polling
+    clients can skip the result payload until the job completes.
+    """
+    job = _get_job_manager().get_job_status(job_id)
 
-        if job['status'] == 'completed' and 'result' in job:
-            response['result'] = convert_decimals_to_floats(job['result'])
-        elif job['status'] == 'failed' and 'error' in job:
-            response['error'] = job['error']
+    if not job:
+        return _error_response('JOB_NOT_FOUND')
 
-        return jsonify(response), 200
+    # Job state only moves forward, so (status, updated_at) is a strong
+    # validator; pollers that present it back skip the body rebuild entirely
+    etag = f'"{job["status"]}-{job.get("updated_at", "")}"'
+    if request.headers.get('If-None-Match') == etag:
+        return current_app.response_class(status=304)
 
-    except Exception as e:
-        logger.error(f"Error getting job status for {job_id}: {str(e)}", exc_info=True)
-        return jsonify({
-            'error': 'Internal server error. Please try again later.',
-            'code': 'INTERNAL_ERROR'
-        }), 500
+    fields_arg = request.args.get('fields')
+    if fields_arg:
+        fields = frozenset(f.strip() for f in fields_arg.split(',')) & _JOB_STATUS_FIELDS
+    else:
+        fields = _JOB_STATUS_FIELDS
+
+    # Return job status
+    response = {'job_id': job['job_id']}
+    if 'status' in fields:
+        response['status'] = job['status']
+    if 'created_at' in fields:
+        response['created_at'] = job.get('created_at')
+    if 'updated_at' in fields:
+        response['updated_at'] = job.get('updated_at')
+
+    if 'result' in fields and job['status'] == 'completed' and 'result' in job:
+        # Completed results can be large (full analyses for dozens of foods).
+        # Stream the envelope and result as separate chunks so the response
+        # never concatenates them into one contiguous buffer; Decimals from
+        # DynamoDB are converted by the default hook during serialization
+        streamed = current_app.response_class(
+            _job_status_stream(response, job['result']),
+            mimetype='application/json'
+        )
+        streamed.headers['ETag'] = etag
+        return streamed
+
+    if 'error' in fields and job['status'] == 'failed' and 'error' in job:
+        response['error'] = job['error']
+
+    resp = _json_response(response)
+    resp.headers['ETag'] = etag
+    return resp
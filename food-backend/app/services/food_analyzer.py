@@ -1,7 +1,13 @@
+import copy
+import functools
 import os
 import logging
+import threading
 import uuid
 import json
+import orjson
+from concurrent.futures import ThreadPoolExecutor
+from cachetools import LFUCache
 from openai import OpenAI
 from typing import Dict, List, Any, Optional
 from app.models.response_models import FoodAnalysisResponse, IngredientQuantity, SubstanceRelationship, SubstanceContribution, CategorizedTip, TipCategory
@@ -9,6 +15,358 @@ from app.models.request_models import FoodAnalysisRequest
 
 logger = logging.getLogger(__name__)
 
+# Comprehensive analysis splits big food lists into chunks of this size and
+# runs the chunks as parallel AI calls
+_COMPREHENSIVE_CHUNK_SIZE = 5
+_analysis_executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix='food-analysis')
+
+# Prompt skeletons are built once at import; per-call work is a .format of
+# the handful of dynamic fields instead of re-allocating the multi-KB text
+_PROMPT_COMPREHENSIVE = """
+        Analyze the food "{food_name}" and provide a complete nutritional breakdown.
+        Return ONLY a valid JSON object with the following structure:
+
+        {{
+          "ingredients": ["ingredient1", "ingredient2", "ingredient3"],
+          "substances": ["substance1", "substance2", "substance3"],
+          "tips": ["Tip 1", "Tip 2", "Tip 3", "Tip 4"],
+          "categorized_tips": {{
+            "exercise": ["tip 1"],
+            "food": ["tip 1", "tip 2"],
+            "drink": ["tip 1"],
+            "lifestyle": ["tip 1"],
+            "nutrition": ["tip 1", "tip 2"],
+            "wellness": ["tip 1"],
+            "mindset": ["tip 1"]
+          }}
+        }}
+
+        Focus on:
+        - Main ingredients typically found in this food (maximum 10)
+        - Beneficial vitamins, minerals, and nutrients (maximum 8)
+        - Practical health tips for maximizing benefits, portion control, and preparation (maximum 4)
+        - Categorized healthy tips covering exercise, food, drink, lifestyle, nutrition, wellness and mindset; include only categories with relevant advice (1-2 tips each)
+
+        Return ONLY valid JSON, no additional text or formatting.
+        """
+
+_PROMPT_QUANTITIES = """
+        Analyze the food "{food_name}" and provide a complete nutritional breakdown {portion_text}.
+        Return ONLY a valid JSON object with the following structure:
+
+        {{
+          "ingredients": ["ingredient1", "ingredient2", "ingredient3"],
+          "quantities": [
+            {{"name": "chicken breast", "original_amount": "150g", "gram_amount": 150}},
+            {{"name": "spinach", "original_amount": "2 cups", "gram_amount": 60}},
+            {{"name": "olive oil", "original_amount": "1 tbsp", "gram_amount": 14}},
+            {{"name": "salt", "original_amount": "to taste", "gram_amount": null}}
+          ],
+          "substances": ["Vitamin C", "antioxidants", "fiber", "protein"],
+          "tips": ["Tip 1", "Tip 2", "Tip 3", "Tip 4"]
+        }}
+
+        Focus on:
+        - Main ingredients with realistic quantities {portion_text} (maximum 10)
+        - Convert common measurements to grams when possible (use null for unknown)
+        - Beneficial vitamins, minerals, and nutrients (maximum 8)
+        - Practical health tips considering portion sizes (maximum 4)
+
+        Return ONLY valid JSON, no additional text or formatting.
+        """
+
+_PROMPT_QUANTITIES_PROFILE = """
+        Analyze the food "{food_name}" and provide a complete nutritional breakdown {portion_text}.
+        {profile_text}
+        Return ONLY a valid JSON object with the following structure:
+
+        {{
+          "ingredients": ["ingredient1", "ingredient2", "ingredient3"],
+          "quantities": [
+            {{"name": "chicken breast", "original_amount": "150g", "gram_amount": 150}},
+            {{"name": "spinach", "original_amount": "2 cups", "gram_amount": 60}},
+            {{"name": "olive oil", "original_amount": "1 tbsp", "gram_amount": 14}},
+            {{"name": "salt", "original_amount": "to taste", "gram_amount": null}}
+          ],
+          "substances": ["Vitamin C", "antioxidants", "fiber", "protein"],
+          "tips": ["Tip 1", "Tip 2", "Tip 3", "Tip 4"]
+        }}
+
+        Focus on:
+        - Main ingredients with realistic quantities {portion_text} (maximum 10)
+        - Convert common measurements to grams when possible (use null for unknown)
+        - Beneficial vitamins, minerals, and nutrients (maximum 8)
+        - Practical health tips considering portion sizes and user profile (maximum 4)
+
+        Return ONLY valid JSON, no additional text or formatting.
+        """
+
+_PROMPT_RELATIONSHIPS = """
+        Analyze the food "{food_name}" and provide a complete nutritional breakdown {portion_text}.
+        Return ONLY a valid JSON object with the following structure:
+
+        {{
+          "ingredients": ["ingredient1", "ingredient2", "ingredient3"],
+          "quantities": [
+            {{"name": "chicken breast", "original_amount": "150g", "gram_amount": 150}},
+            {{"name": "spinach", "original_amount": "2 cups", "gram_amount": 60}},
+            {{"name": "olive oil", "original_amount": "1 tbsp", "gram_amount": 14}},
+            {{"name": "salt", "original_amount": "to taste", "gram_amount": null}}
+          ],
+          "substances": ["Vitamin C", "protein", "sodium", "fiber", "antioxidants"],
+          "relationships": [
+            {{
+              "name": "Vitamin C",
+              "category": "vitamin",
+              "health_impact": "positive",
+              "total_quantity": 90,
+              "unit": "mg",
+              "contributions": [
+                {{
+                  "ingredient_name": "orange",
+                  "quantity_grams": 80,
+                  "contribution_percentage": 89,
+                  "relationship_type": "primary"
+                }},
+                {{
+                  "ingredient_name": "strawberry",
+                  "quantity_grams": 8,
+                  "contribution_percentage": 9,
+                  "relationship_type": "secondary"
+                }}
+              ]
+            }},
+            {{
+              "name": "Sodium",
+              "category": "mineral",
+              "health_impact": "negative",
+              "total_quantity": 450,
+              "unit": "mg",
+              "contributions": [
+                {{
+                  "ingredient_name": "salt",
+                  "quantity_grams": 400,
+                  "contribution_percentage": 89,
+                  "relationship_type": "primary"
+                }}
+              ]
+            }}
+          ],
+          "tips": ["Tip 1", "Tip 2", "Tip 3", "Tip 4"],
+          "categorized_tips": {{
+            "exercise": ["tip 1"],
+            "food": ["tip 1", "tip 2"],
+            "drink": ["tip 1"],
+            "lifestyle": ["tip 1"],
+            "nutrition": ["tip 1", "tip 2"],
+            "wellness": ["tip 1"],
+            "mindset": ["tip 1"]
+          }}
+        }}
+
+        Focus on:
+        - Main ingredients with realistic quantities {portion_text} (maximum 10)
+        - Convert common measurements to grams when possible (use null for unknown)
+        - ALL absorbable substances (positive, neutral, negative health impacts) (maximum 8)
+        - Complete ingredient-substance relationship mapping (maximum 8 relationships)
+        - Practical health tips considering all substances present (maximum 4)
+        - Categorized healthy tips covering exercise, food, drink, lifestyle, nutrition, wellness and mindset; include only categories with relevant advice (1-2 tips each)
+
+        Health impact categories:
+        - positive: beneficial for health (e.g., Vitamin C, fiber, antioxidants, omega-3, protein)
+        - neutral: neither clearly beneficial nor harmful (e.g., water, some minerals in normal amounts)
+        - negative: potentially harmful or should be limited (e.g., excess sodium, trans fats, artificial additives, excess sugar)
+
+        Return ONLY valid JSON, no additional text or formatting.
+        """
+
+
+@functools.lru_cache(maxsize=256)
+def _render_profile_block(age_group, weight, height) -> str:
+    """Render the profile section of an analysis prompt; memoized because
+    the same profile accompanies every request from a given user"""
+    return f"""
+            User Profile Information:
+            - Age group: {age_group}
+            - Weight: {weight} cm
+            - Height: {height} cm
+
+            Consider appropriate portion sizes based on the user's age group and physical characteristics.
+            For example:
+            - Children (0-18): Smaller portions, focus on nutrient-dense foods
+            - Adults (19-40): Standard portions with balanced nutrition
+            - Seniors (>40): Moderate portions, consider digestive health and nutrient absorption
+            """
+
+
+@functools.lru_cache(maxsize=4)
+def _get_client(api_key: str, base_url: Optional[str]) -> OpenAI:
+    """Shared OpenAI client per credential set; reusing one client keeps a
+    single connection pool alive across FoodAnalyzer instances instead of
+    re-establishing TLS sessions for every instance"""
+    if base_url:
+        return OpenAI(api_key=api_key, base_url=base_url)
+    return OpenAI(api_key=api_key)
+
+
+def _mint_ids(n: int) -> List[str]:
+    """Generate n random UUID strings from a single urandom read; one
+    syscall instead of one per uuid.uuid4() in tip-construction loops"""
+    buf = os.urandom(16 * n)
+    return [str(uuid.UUID(bytes=buf[i:i + 16], version=4))
+            for i in range(0, 16 * n, 16)]
+
+
+def _extract_json_object(response_text: str):
+    """Extract and parse the JSON object embedded in a model response
+
+    Encodes once and scans the bytes for the outer braces, handing orjson
+    the UTF-8 slice directly instead of re-encoding a str substring.
+    Raises json.JSONDecodeError when no object is found.
+    """
+    raw = response_text.encode('utf-8')
+    json_start = raw.find(b'{')
+    json_end = raw.rfind(b'}') + 1
+
+    if json_start == -1 or json_end == 0:
+        logger.warning(f"No JSON object found in response: {response_text[:500]}")
+        raise json.JSONDecodeError("No JSON object found", response_text, 0)
+
+    return orjson.loads(raw[json_start:json_end])
+
+
+def _parse_analysis_payload(response_text: str, portion_for_one: bool):
+    """Parse the common part of a structured analysis response
+
+    Extracts the JSON object, validates the shared fields and builds the
+    IngredientQuantity list with the usual defaults. Returns
+    (parsed_data, ingredients, ingredient_quantities, substances,
+    mitigation_tips); raises json.JSONDecodeError when no object is found.
+    """
+    parsed_data = _extract_json_object(response_text)
+
+    # Extract data from JSON structure
+    ingredients = parsed_data.get('ingredients', [])
+    quantities_data = parsed_data.get('quantities', [])
+    substances = parsed_data.get('substances', [])
+    mitigation_tips = parsed_data.get('tips', [])
+
+    # Validate and ensure we have arrays
+    if not isinstance(ingredients, list):
+        ingredients = ["Unable to determine ingredients"]
+    if not isinstance(quantities_data, list):
+        quantities_data = []
+    if not isinstance(substances, list):
+        substances = ["Analysis not available"]
+    if not isinstance(mitigation_tips, list):
+        mitigation_tips = ["General healthy eating advice applies"]
+
+    # Process ingredient quantities from JSON
+    ingredient_quantities = []
+    for qty_data in quantities_data:
+        if isinstance(qty_data, dict) and 'name' in qty_data:
+            name = qty_data['name']
+            original_amount = qty_data.get('original_amount')
+            gram_amount = qty_data.get('gram_amount')
+
+            # Validate gram_amount
+            if gram_amount is not None:
+                try:
+                    gram_amount = float(gram_amount)
+                    if gram_amount < 0 or gram_amount > 5000:
+                        logger.warning(f"Invalid gram amount {gram_amount} for {name}, setting to None")
+                        gram_amount = None
+                except (ValueError, TypeError):
+                    gram_amount = None
+
+            ingredient_quantities.append(IngredientQuantity(
+                name=name,
+                original_amount=original_amount if original_amount and str(original_amount).lower() not in ['unknown', 'none', ''] else None,
+                gram_amount=gram_amount,
+                per_person=portion_for_one
+            ))
+
+    # Create ingredient quantities from ingredients list if not already parsed
+    if not ingredient_quantities and ingredients:
+        for ingredient in ingredients:
+            ingredient_quantities.append(IngredientQuantity(
+                name=ingredient,
+                original_amount=None,
+                gram_amount=None,
+                per_person=portion_for_one
+            ))
+
+    # Ensure we have reasonable defaults
+    if not ingredients:
+        ingredients = ["Unable to determine ingredients"]
+        ingredient_quantities = [IngredientQuantity(
+            name="Unable to determine ingredients",
+            original_amount=None,
+            gram_amount=None,
+            per_person=portion_for_one
+        )]
+    if not substances:
+        substances = ["Analysis not available"]
+    if not mitigation_tips:
+        mitigation_tips = ["General healthy eating advice applies"]
+
+    return parsed_data, ingredients, ingredient_quantities, substances, mitigation_tips
+
+
+def _default_categorized_tips() -> List[CategorizedTip]:
+    """Fallback tip list used when the model omits categorized tips"""
+    return [
+        CategorizedTip(
+            id=str(uuid.uuid4()),
+            category=TipCategory.LIFESTYLE,
+            title="General Healthy Eating",
+            content="Practice mindful eating and maintain balanced nutrition.",
+            priority='medium',
+            relevance_score=0.5,
+            tags=["general", "health"]
+        )
+    ]
+
+
+def _build_categorized_tips(tips_data) -> List[CategorizedTip]:
+    """Build CategorizedTip objects from the categorized_tips mapping of the
+    primary analysis response; no extra AI call involved"""
+    if not isinstance(tips_data, dict):
+        return _default_categorized_tips()
+
+    entries = []
+    for category_str, tips_list in tips_data.items():
+        try:
+            category = TipCategory(category_str.lower())
+        except ValueError:
+            logger.warning(f"Invalid category: {category_str}")
+            continue
+        if not isinstance(tips_list, list):
+            continue
+        for i, tip_text in enumerate(tips_list):
+            if tip_text and tip_text.strip():
+                entries.append((category, category_str.lower(), tip_text.strip(), i))
+
+    if not entries:
+        return _default_categorized_tips()
+
+    entries = entries[:10]  # Limit to 10 tips max
+    categorized_tips = []
+    for tip_id, (category, category_key, content, i) in zip(_mint_ids(len(entries)), entries):
+        # Create title from first part of tip
+        title = content if len(content) <= 50 else content[:47] + "..."
+        categorized_tips.append(CategorizedTip(
+            id=tip_id,
+            category=category,
+            title=title,
+            content=content,
+            priority='high' if i == 0 else 'medium',
+            relevance_score=0.9 if i == 0 else 0.7,
+            tags=[category_key, "health"]
+        ))
+    return categorized_tips
+
+
 class FoodAnalyzer:
     """Service for analyzing food using GenAI prompt chaining"""
 
@@ -32,18 +390,49 @@ class FoodAnalyzer:
 
             # Create OpenAI client with proper configuration
             if self.provider == 'openrouter':
-                self.client = OpenAI(
-                    api_key=self.api_key,
-                    base_url="https://openrouter.ai/api/v1"
-                )
+                self.client = _get_client(self.api_key, "https://openrouter.ai/api/v1")
                 logger.info(f"Using OpenRouter with model: {self.model}")
             else:
-                self.client = OpenAI(api_key=self.api_key)
+                self.client = _get_client(self.api_key, None)
                 logger.info(f"Using OpenAI with model: {self.model}")
 
         # Disclaimer to include in responses
         self.disclaimer = "This is AI-generated information for educational purposes only and should not be considered as professional medical or nutritional advice."
 
+        # Finished analyses keyed by (method, food, portion, profile); repeat
+        # requests for popular foods skip the model round trip entirely. LFU
+        # eviction keeps the frequently asked foods resident
+        self._result_cache = LFUCache(maxsize=2048)
+        self._result_cache_lock = threading.RLock()
+
+    @staticmethod
+    def _profile_key(user_profile) -> Optional[tuple]:
+        """Hashable cache-key fragment for an optional user profile"""
+        if user_profile is None:
+            return None
+        return (user_profile.age_group, user_profile.weight, user_profile.height)
+
+    def _cached_result(self, cache_key) -> Optional[Dict[str, Any]]:
+        """Return a deep copy of a cached analysis, or None on miss
+
+        Copying on the way out keeps callers free to mutate their response
+        without corrupting the cached original.
+        """
+        with self._result_cache_lock:
+            cached = self._result_cache.get(cache_key)
+        return copy.deepcopy(cached) if cached is not None else None
+
+    def _store_result(self, cache_key, result: Dict[str, Any]) -> Dict[str, Any]:
+        """Cache a freshly computed result and hand the caller a private copy
+
+        Returning a copy on the miss path mirrors the copy-on-hit in
+        _cached_result: the first caller must not hold an alias into the
+        cache, or mutating its response would poison every later hit.
+        """
+        with self._result_cache_lock:
+            self._result_cache[cache_key] = result
+        return copy.deepcopy(result)
+
     def analyze_food(self, food_name: str) -> Dict[str, Any]:
         """
         Analyze a food using optimized GenAI prompt chaining with only 1 request
@@ -53,14 +442,21 @@ class FoodAnalyzer:
             if self.use_mock:
                 return self._get_mock_response(food_name)
 
+            cache_key = ('basic', food_name.strip().casefold())
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
+
             # Single comprehensive analysis call
             ingredients, substances, mitigation_tips, categorized_tips = self._analyze_food_comprehensive(food_name)
-            print(f"Ingredients: {ingredients}")
-            print(f"Substances: {substances}")
-            print(f"Tips: {mitigation_tips}")
-            print(f"Categorized Tips: {len(categorized_tips)} tips across {len(set(t.category.value for t in categorized_tips))} categories")
-
-            return FoodAnalysisResponse(
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Ingredients: %s", ingredients)
+                logger.debug("Substances: %s", substances)
+                logger.debug("Tips: %s", mitigation_tips)
+                logger.debug("Categorized Tips: %d tips across %d categories",
+                             len(categorized_tips), len(set(t.category.value for t in categorized_tips)))
+
+            return self._store_result(cache_key, FoodAnalysisResponse(
                 ingredients=ingredients,
                 ingredient_quantities=[],  # Empty for backward compatibility
                 substances=substances,
@@ -68,7 +464,7 @@ class FoodAnalyzer:
                 mitigation_tips=mitigation_tips,
                 categorized_tips=categorized_tips,
                 disclaimer=self.disclaimer
-            ).to_dict()
+            ).to_dict())
 
         except Exception as e:
             logger.error(f"Error analyzing food {food_name}: {str(e)}")
@@ -91,33 +487,54 @@ class FoodAnalyzer:
             if self.use_mock:
                 return self._get_mock_response_with_profile(food_name, user_profile)
 
+            cache_key = ('profile', food_name.strip().casefold(), portion_for_one,
+                         self._profile_key(user_profile))
+            cached = self._cached_result(cache_key)
+            if cached is not None:
+                return cached
+
+            # Step 2 only needs the food name and profile, so kick it off
+            # concurrently with step 1 instead of serializing the two AI calls
+            personalization_future = None
+            if user_profile:
+                personalization_future = _analysis_executor.submit(
+                    self._generate_personalized_recommendations, food_name, user_profile)
+
             # Step 1: Combined analysis - ingredients with quantities, substances with relationships, and general tips in one call
-            # Include profile information for portion personalization if available
-            ingredients, ingredient_quantities, substances, substance_relationships, mitigation_tips, categorized_tips = self._analyze_food_with_relationships_and_profile(
-                food_name, portion_for_one, user_profile
-            )
-            print(f"Ingredients: {ingredients}")
-            print(f"Ingredient Quantities: {[iq.name + (f' ({iq.gram_amount}g)' if iq.gram_amount else '') for iq in ingredient_quantities]}")
-            print(f"Substances: {substances}")
-            print(f"Substance Relationships: {[sr.name + f' ({len(sr.contributions)} contributors, impact: {sr.health_impact}, qty: {sr.total_quantity})' for sr in substance_relationships]}")
-            print(f"Tips: {mitigation_tips}")
-            print(f"Categorized Tips: {len(categorized_tips)} tips across {len(set(t.category.value for t in categorized_tips))} categories")
-
-            # Debug: Print detailed relationship info
-            for sr in substance_relationships:
-                print(f"  Relationship: {sr.name} - {sr.health_impact} - {len(sr.contributions)} contributions")
-                for contrib in sr.contributions[:2]:  # Show first 2 contributions
-                    print(f"    {contrib.ingredient_name}: {contrib.contribution_percentage}% ({contrib.relationship_type})")
-
-            # Step 2: Generate personalized recommendations if profile is available (2nd call)
+            # The breakdown is profile-independent, so it is cached by
+            # (food, portion) and shared across users with different profiles
+            step_key = ('relationships', food_name.strip().casefold(), portion_for_one)
+            analysis = self._cached_result(step_key)
+            if analysis is None:
+                analysis = self._store_result(
+                    step_key, self._analyze_food_with_relationships(food_name, portion_for_one))
+            ingredients, ingredient_quantities, substances, substance_relationships, mitigation_tips, categorized_tips = analysis
+            # The relationship summaries build sizeable intermediate lists, so
+            # skip all of it unless debug logging is actually enabled
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Ingredients: %s", ingredients)
+                logger.debug("Ingredient Quantities: %s",
+                             [iq.name + (f' ({iq.gram_amount}g)' if iq.gram_amount else '') for iq in ingredient_quantities])
+                logger.debug("Substances: %s", substances)
+                logger.debug("Substance Relationships: %s",
+                             [sr.name + f' ({len(sr.contributions)} contributors, impact: {sr.health_impact}, qty: {sr.total_quantity})' for sr in substance_relationships])
+                logger.debug("Tips: %s", mitigation_tips)
+                logger.debug("Categorized Tips: %d tips across %d categories",
+                             len(categorized_tips), len(set(t.category.value for t in categorized_tips)))
+                for sr in substance_relationships:
+                    logger.debug("  Relationship: %s - %s - %d contributions",
+                                 sr.name, sr.health_impact, len(sr.contributions))
+                    for contrib in sr.contributions[:2]:  # Show first 2 contributions
+                        logger.debug("    %s: %s%% (%s)", contrib.ingredient_name,
+                                     contrib.contribution_percentage, contrib.relationship_type)
+
+            # Step 2: Collect the personalized recommendations started above
             personalized_recommendations = None
-            if user_profile:
-                personalized_recommendations = self._generate_personalized_recommendations(
-                    food_name, ingredients, substances, user_profile
-                )
-                print(f"Personalized: {personalized_recommendations}")
+            if personalization_future is not None:
+                personalized_recommendations = personalization_future.result()
+                logger.debug("Personalized: %s", personalized_recommendations)
 
-            return FoodAnalysisResponse(
+            return self._store_result(cache_key, FoodAnalysisResponse(
                 ingredients=ingredients,
                 ingredient_quantities=ingredient_quantities,
                 substances=substances,
@@ -127,7 +544,7 @@ class FoodAnalyzer:
                 disclaimer=self.disclaimer,
                 portion_for_one=portion_for_one,
                 personalized_recommendations=personalized_recommendations
-            ).to_dict()
+            ).to_dict())
 
         except Exception as e:
             logger.error(f"Error analyzing food {food_name}: {str(e)}")
@@ -139,23 +556,7 @@ class FoodAnalyzer:
         Comprehensive food analysis in a single AI call with structured JSON response
         Returns: (ingredients, substances, mitigation_tips, categorized_tips)
         """
-        prompt = f"""
-        Analyze the food "{food_name}" and provide a complete nutritional breakdown.
-        Return ONLY a valid JSON object with the following structure:
-
-        {{
-          "ingredients": ["ingredient1", "ingredient2", "ingredient3"],
-          "substances": ["substance1", "substance2", "substance3"],
-          "tips": ["Tip 1", "Tip 2", "Tip 3", "Tip 4"]
-        }}
-
-        Focus on:
-        - Main ingredients typically found in this food (maximum 10)
-        - Beneficial vitamins, minerals, and nutrients (maximum 8)
-        - Practical health tips for maximizing benefits, portion control, and preparation (maximum 4)
-
-        Return ONLY valid JSON, no additional text or formatting.
-        """
+        prompt = _PROMPT_COMPREHENSIVE.format(food_name=food_name)
 
         try:
             response = self.client.chat.completions.create(
@@ -164,7 +565,7 @@ class FoodAnalyzer:
                     {"role": "system", "content": "You are a nutrition expert. Always return valid JSON responses with the exact structure requested."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=600,
+                max_tokens=900,  # Old 600 budget plus headroom for the inlined categorized_tips block
                 temperature=0.3
             )
 
@@ -172,16 +573,7 @@ class FoodAnalyzer:
 
             # Parse JSON response
             try:
-                # Clean up response text to extract JSON
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
-
-                if json_start == -1 or json_end == 0:
-                    logger.warning(f"No JSON object found in response: {response_text}")
-                    raise json.JSONDecodeError("No JSON object found", response_text, 0)
-
-                json_content = response_text[json_start:json_end]
-                parsed_data = json.loads(json_content)
+                parsed_data = _extract_json_object(response_text)
 
                 # Extract data from JSON structure
                 ingredients = parsed_data.get('ingredients', [])
@@ -209,8 +601,9 @@ class FoodAnalyzer:
             # substances = substances  # Keep all
             # mitigation_tips = mitigation_tips  # Keep all
 
-                # Generate categorized tips
-                categorized_tips = self._generate_categorized_tips(food_name, ingredients, substances)
+                # Categorized tips arrive in the same response now; just
+                # build the structured objects locally
+                categorized_tips = _build_categorized_tips(parsed_data.get('categorized_tips'))
 
                 return ingredients, substances, mitigation_tips, categorized_tips
 
@@ -224,17 +617,7 @@ class FoodAnalyzer:
                 ["Unable to determine ingredients"],
                 ["Analysis not available"],
                 ["General healthy eating advice applies"],
-                [
-                    CategorizedTip(
-                        id=str(uuid.uuid4()),
-                        category=TipCategory.LIFESTYLE,
-                        title="General Healthy Eating",
-                        content="Practice mindful eating and maintain balanced nutrition.",
-                        priority='medium',
-                        relevance_score=0.5,
-                        tags=["general", "health"]
-                    )
-                ]
+                _default_categorized_tips()
             )
 
 
@@ -245,30 +628,7 @@ class FoodAnalyzer:
         """
         portion_text = "for one person" if portion_for_one else "for multiple people (scale down to single serving)"
 
-        prompt = f"""
-        Analyze the food "{food_name}" and provide a complete nutritional breakdown {portion_text}.
-        Return ONLY a valid JSON object with the following structure:
-
-        {{
-          "ingredients": ["ingredient1", "ingredient2", "ingredient3"],
-          "quantities": [
-            {{"name": "chicken breast", "original_amount": "150g", "gram_amount": 150}},
-            {{"name": "spinach", "original_amount": "2 cups", "gram_amount": 60}},
-            {{"name": "olive oil", "original_amount": "1 tbsp", "gram_amount": 14}},
-            {{"name": "salt", "original_amount": "to taste", "gram_amount": null}}
-          ],
-          "substances": ["Vitamin C", "antioxidants", "fiber", "protein"],
-          "tips": ["Tip 1", "Tip 2", "Tip 3", "Tip 4"]
-        }}
-
-        Focus on:
-        - Main ingredients with realistic quantities {portion_text} (maximum 10)
-        - Convert common measurements to grams when possible (use null for unknown)
-        - Beneficial vitamins, minerals, and nutrients (maximum 8)
-        - Practical health tips considering portion sizes (maximum 4)
-
-        Return ONLY valid JSON, no additional text or formatting.
-        """
+        prompt = _PROMPT_QUANTITIES.format(food_name=food_name, portion_text=portion_text)
 
         try:
             response = self.client.chat.completions.create(
@@ -277,7 +637,7 @@ class FoodAnalyzer:
                     {"role": "system", "content": "You are a nutrition expert. Always return valid JSON responses with the exact structure requested."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=800,
+                max_tokens=512,  # Sized to the quantities schema; excess headroom just adds latency
                 temperature=0.3
             )
 
@@ -285,87 +645,8 @@ class FoodAnalyzer:
 
             # Parse JSON response
             try:
-                # Clean up response text to extract JSON
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
-
-                if json_start == -1 or json_end == 0:
-                    logger.warning(f"No JSON object found in response: {response_text}")
-                    raise json.JSONDecodeError("No JSON object found", response_text, 0)
-
-                json_content = response_text[json_start:json_end]
-                parsed_data = json.loads(json_content)
-
-                # Extract data from JSON structure
-                ingredients = parsed_data.get('ingredients', [])
-                quantities_data = parsed_data.get('quantities', [])
-                substances = parsed_data.get('substances', [])
-                mitigation_tips = parsed_data.get('tips', [])
-
-                # Validate and ensure we have arrays
-                if not isinstance(ingredients, list):
-                    ingredients = ["Unable to determine ingredients"]
-                if not isinstance(quantities_data, list):
-                    quantities_data = []
-                if not isinstance(substances, list):
-                    substances = ["Analysis not available"]
-                if not isinstance(mitigation_tips, list):
-                    mitigation_tips = ["General healthy eating advice applies"]
-
-                # Process ingredient quantities from JSON
-                ingredient_quantities = []
-                for qty_data in quantities_data:
-                    if isinstance(qty_data, dict) and 'name' in qty_data:
-                        name = qty_data['name']
-                        original_amount = qty_data.get('original_amount')
-                        gram_amount = qty_data.get('gram_amount')
-
-                        # Validate gram_amount
-                        if gram_amount is not None:
-                            try:
-                                gram_amount = float(gram_amount)
-                                if gram_amount < 0 or gram_amount > 5000:
-                                    logger.warning(f"Invalid gram amount {gram_amount} for {name}, setting to None")
-                                    gram_amount = None
-                            except (ValueError, TypeError):
-                                gram_amount = None
-
-                        ingredient_quantities.append(IngredientQuantity(
-                            name=name,
-                            original_amount=original_amount if original_amount and str(original_amount).lower() not in ['unknown', 'none', ''] else None,
-                            gram_amount=gram_amount,
-                            per_person=portion_for_one
-                        ))
-
-                # Create ingredient quantities from ingredients list if not already parsed
-                if not ingredient_quantities and ingredients:
-                    for ingredient in ingredients:
-                        ingredient_quantities.append(IngredientQuantity(
-                            name=ingredient,
-                            original_amount=None,
-                            gram_amount=None,
-                            per_person=portion_for_one
-                        ))
-
-                # Ensure we have reasonable defaults
-                if not ingredients:
-                    ingredients = ["Unable to determine ingredients"]
-                    ingredient_quantities = [IngredientQuantity(
-                        name="Unable to determine ingredients",
-                        original_amount=None,
-                        gram_amount=None,
-                        per_person=portion_for_one
-                    )]
-                if not substances:
-                    substances = ["Analysis not available"]
-                if not mitigation_tips:
-                    mitigation_tips = ["General healthy eating advice applies"]
-
-                # Keep all results (no arbitrary limits)
-                # ingredients = ingredients  # Keep all
-                # ingredient_quantities = ingredient_quantities  # Keep all
-                # substances = substances  # Keep all
-                # mitigation_tips = mitigation_tips  # Keep all
+                _, ingredients, ingredient_quantities, substances, mitigation_tips = \
+                    _parse_analysis_payload(response_text, portion_for_one)
 
                 return ingredients, ingredient_quantities, substances, mitigation_tips
 
@@ -396,46 +677,12 @@ class FoodAnalyzer:
         portion_text = "for one person" if portion_for_one else "for multiple people (scale down to single serving)"
 
         # Include profile information for portion personalization
-        profile_text = ""
-        if user_profile:
-            profile_text = f"""
-            User Profile Information:
-            - Age group: {user_profile.age_group}
-            - Weight: {user_profile.weight} cm
-            - Height: {user_profile.height} cm
-
-            Consider appropriate portion sizes based on the user's age group and physical characteristics.
-            For example:
-            - Children (0-18): Smaller portions, focus on nutrient-dense foods
-            - Adults (19-40): Standard portions with balanced nutrition
-            - Seniors (>40): Moderate portions, consider digestive health and nutrient absorption
-            """
-
-        prompt = f"""
-        Analyze the food "{food_name}" and provide a complete nutritional breakdown {portion_text}.
-        {profile_text}
-        Return ONLY a valid JSON object with the following structure:
-
-        {{
-          "ingredients": ["ingredient1", "ingredient2", "ingredient3"],
-          "quantities": [
-            {{"name": "chicken breast", "original_amount": "150g", "gram_amount": 150}},
-            {{"name": "spinach", "original_amount": "2 cups", "gram_amount": 60}},
-            {{"name": "olive oil", "original_amount": "1 tbsp", "gram_amount": 14}},
-            {{"name": "salt", "original_amount": "to taste", "gram_amount": null}}
-          ],
-          "substances": ["Vitamin C", "antioxidants", "fiber", "protein"],
-          "tips": ["Tip 1", "Tip 2", "Tip 3", "Tip 4"]
-        }}
+        profile_text = _render_profile_block(
+            user_profile.age_group, user_profile.weight, user_profile.height
+        ) if user_profile else ""
 
-        Focus on:
-        - Main ingredients with realistic quantities {portion_text} (maximum 10)
-        - Convert common measurements to grams when possible (use null for unknown)
-        - Beneficial vitamins, minerals, and nutrients (maximum 8)
-        - Practical health tips considering portion sizes and user profile (maximum 4)
-
-        Return ONLY valid JSON, no additional text or formatting.
-        """
+        prompt = _PROMPT_QUANTITIES_PROFILE.format(
+            food_name=food_name, portion_text=portion_text, profile_text=profile_text)
 
         try:
             response = self.client.chat.completions.create(
@@ -444,7 +691,7 @@ class FoodAnalyzer:
                     {"role": "system", "content": "You are a nutrition expert. Always return valid JSON responses with the exact structure requested."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=900,  # Increased for profile information
+                max_tokens=512,  # Sized to the quantities schema; excess headroom just adds latency
                 temperature=0.3
             )
 
@@ -452,87 +699,8 @@ class FoodAnalyzer:
 
             # Parse JSON response
             try:
-                # Clean up response text to extract JSON
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
-
-                if json_start == -1 or json_end == 0:
-                    logger.warning(f"No JSON object found in response: {response_text}")
-                    raise json.JSONDecodeError("No JSON object found", response_text, 0)
-
-                json_content = response_text[json_start:json_end]
-                parsed_data = json.loads(json_content)
-
-                # Extract data from JSON structure
-                ingredients = parsed_data.get('ingredients', [])
-                quantities_data = parsed_data.get('quantities', [])
-                substances = parsed_data.get('substances', [])
-                mitigation_tips = parsed_data.get('tips', [])
-
-                # Validate and ensure we have arrays
-                if not isinstance(ingredients, list):
-                    ingredients = ["Unable to determine ingredients"]
-                if not isinstance(quantities_data, list):
-                    quantities_data = []
-                if not isinstance(substances, list):
-                    substances = ["Analysis not available"]
-                if not isinstance(mitigation_tips, list):
-                    mitigation_tips = ["General healthy eating advice applies"]
-
-                # Process ingredient quantities from JSON
-                ingredient_quantities = []
-                for qty_data in quantities_data:
-                    if isinstance(qty_data, dict) and 'name' in qty_data:
-                        name = qty_data['name']
-                        original_amount = qty_data.get('original_amount')
-                        gram_amount = qty_data.get('gram_amount')
-
-                        # Validate gram_amount
-                        if gram_amount is not None:
-                            try:
-                                gram_amount = float(gram_amount)
-                                if gram_amount < 0 or gram_amount > 5000:
-                                    logger.warning(f"Invalid gram amount {gram_amount} for {name}, setting to None")
-                                    gram_amount = None
-                            except (ValueError, TypeError):
-                                gram_amount = None
-
-                        ingredient_quantities.append(IngredientQuantity(
-                            name=name,
-                            original_amount=original_amount if original_amount and str(original_amount).lower() not in ['unknown', 'none', ''] else None,
-                            gram_amount=gram_amount,
-                            per_person=portion_for_one
-                        ))
-
-                # Create ingredient quantities from ingredients list if not already parsed
-                if not ingredient_quantities and ingredients:
-                    for ingredient in ingredients:
-                        ingredient_quantities.append(IngredientQuantity(
-                            name=ingredient,
-                            original_amount=None,
-                            gram_amount=None,
-                            per_person=portion_for_one
-                        ))
-
-                # Ensure we have reasonable defaults
-                if not ingredients:
-                    ingredients = ["Unable to determine ingredients"]
-                    ingredient_quantities = [IngredientQuantity(
-                        name="Unable to determine ingredients",
-                        original_amount=None,
-                        gram_amount=None,
-                        per_person=portion_for_one
-                    )]
-                if not substances:
-                    substances = ["Analysis not available"]
-                if not mitigation_tips:
-                    mitigation_tips = ["General healthy eating advice applies"]
-
-                # Keep all results (no arbitrary limits)
-                # ingredients = ingredients  # Keep all
-                # ingredient_quantities = ingredient_quantities  # Keep all
-                # substances = substances  # Keep all
-                # mitigation_tips = mitigation_tips  # Keep all
+                _, ingredients, ingredient_quantities, substances, mitigation_tips = \
+                    _parse_analysis_payload(response_text, portion_for_one)
 
                 return ingredients, ingredient_quantities, substances, mitigation_tips
 
@@ -555,98 +723,20 @@ class FoodAnalyzer:
                 ["General healthy eating advice applies"]
             )
 
-    def _analyze_food_with_relationships_and_profile(self, food_name: str, portion_for_one: bool = True, user_profile=None) -> tuple[List[str], List[IngredientQuantity], List[str], List[SubstanceRelationship], List[str], List[CategorizedTip]]:
+    def _analyze_food_with_relationships(self, food_name: str, portion_for_one: bool = True) -> tuple[List[str], List[IngredientQuantity], List[str], List[SubstanceRelationship], List[str], List[CategorizedTip]]:
         """
-        Comprehensive food analysis with quantity extraction, substance relationships, and profile personalization using structured JSON response
+        Comprehensive food analysis with quantity extraction and substance relationships using structured JSON response
+
+        Deliberately profile-independent: the ingredient/substance breakdown
+        of a food does not change per user, which lets callers cache this
+        step by (food_name, portion) and share it across profiles. The
+        profile-specific output comes from _generate_personalized_recommendations.
         Returns: (ingredients, ingredient_quantities, substances, substance_relationships, mitigation_tips, categorized_tips)
         """
         portion_text = "for one person" if portion_for_one else "for multiple people (scale down to single serving)"
 
-        # Include profile information for portion personalization
-        profile_text = ""
-        if user_profile:
-            profile_text = f"""
-            User Profile Information:
-            - Age group: {user_profile.age_group}
-            - Weight: {user_profile.weight} cm
-            - Height: {user_profile.height} cm
-
-            Consider appropriate portion sizes based on the user's age group and physical characteristics.
-            For example:
-            - Children (0-18): Smaller portions, focus on nutrient-dense foods
-            - Adults (19-40): Standard portions with balanced nutrition
-            - Seniors (>40): Moderate portions, consider digestive health and nutrient absorption
-            """
-
-        prompt = f"""
-        Analyze the food "{food_name}" and provide a complete nutritional breakdown {portion_text}.
-        {profile_text}
-        Return ONLY a valid JSON object with the following structure:
-
-        {{
-          "ingredients": ["ingredient1", "ingredient2", "ingredient3"],
-          "quantities": [
-            {{"name": "chicken breast", "original_amount": "150g", "gram_amount": 150}},
-            {{"name": "spinach", "original_amount": "2 cups", "gram_amount": 60}},
-            {{"name": "olive oil", "original_amount": "1 tbsp", "gram_amount": 14}},
-            {{"name": "salt", "original_amount": "to taste", "gram_amount": null}}
-          ],
-          "substances": ["Vitamin C", "protein", "sodium", "fiber", "antioxidants"],
-          "relationships": [
-            {{
-              "name": "Vitamin C",
-              "category": "vitamin",
-              "health_impact": "positive",
-              "total_quantity": 90,
-              "unit": "mg",
-              "contributions": [
-                {{
-                  "ingredient_name": "orange",
-                  "quantity_grams": 80,
-                  "contribution_percentage": 89,
-                  "relationship_type": "primary"
-                }},
-                {{
-                  "ingredient_name": "strawberry",
-                  "quantity_grams": 8,
-                  "contribution_percentage": 9,
-                  "relationship_type": "secondary"
-                }}
-              ]
-            }},
-            {{
-              "name": "Sodium",
-              "category": "mineral",
-              "health_impact": "negative",
-              "total_quantity": 450,
-              "unit": "mg",
-              "contributions": [
-                {{
-                  "ingredient_name": "salt",
-                  "quantity_grams": 400,
-                  "contribution_percentage": 89,
-                  "relationship_type": "primary"
-                }}
-              ]
-            }}
-          ],
-          "tips": ["Tip 1", "Tip 2", "Tip 3", "Tip 4"]
-        }}
-
-        Focus on:
-        - Main ingredients with realistic quantities {portion_text} (maximum 10)
-        - Convert common measurements to grams when possible (use null for unknown)
-        - ALL absorbable substances (positive, neutral, negative health impacts) (maximum 8)
-        - Complete ingredient-substance relationship mapping (maximum 8 relationships)
-        - Practical health tips considering all substances present (maximum 4)
-
-        Health impact categories:
-        - positive: beneficial for health (e.g., Vitamin C, fiber, antioxidants, omega-3, protein)
-        - neutral: neither clearly beneficial nor harmful (e.g., water, some minerals in normal amounts)
-        - negative: potentially harmful or should be limited (e.g., excess sodium, trans fats, artificial additives, excess sugar)
-
-        Return ONLY valid JSON, no additional text or formatting.
-        """
+        prompt = _PROMPT_RELATIONSHIPS.format(
+            food_name=food_name, portion_text=portion_text)
 
         try:
             response = self.client.chat.completions.create(
@@ -655,7 +745,7 @@ class FoodAnalyzer:
                     {"role": "system", "content": "You are a nutrition expert. Always return valid JSON responses with the exact structure requested."},
                     {"role": "user", "content": prompt}
                 ],
-                max_tokens=1000,  # Increased for relationship data
+                max_tokens=1300,  # Old 1000 budget plus headroom for the inlined categorized_tips block
                 temperature=0.3
             )
 
@@ -663,60 +753,12 @@ class FoodAnalyzer:
 
             # Parse JSON response
             try:
-                # Clean up response text to extract JSON
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
-
-                if json_start == -1 or json_end == 0:
-                    logger.warning(f"No JSON object found in response: {response_text}")
-                    raise json.JSONDecodeError("No JSON object found", response_text, 0)
+                parsed_data, ingredients, ingredient_quantities, substances, mitigation_tips = \
+                    _parse_analysis_payload(response_text, portion_for_one)
 
-                json_content = response_text[json_start:json_end]
-                parsed_data = json.loads(json_content)
-
-                # Extract data from JSON structure
-                ingredients = parsed_data.get('ingredients', [])
-                quantities_data = parsed_data.get('quantities', [])
-                substances = parsed_data.get('substances', [])
                 relationships_data = parsed_data.get('relationships', [])
-                mitigation_tips = parsed_data.get('tips', [])
-
-                # Validate and ensure we have arrays
-                if not isinstance(ingredients, list):
-                    ingredients = ["Unable to determine ingredients"]
-                if not isinstance(quantities_data, list):
-                    quantities_data = []
-                if not isinstance(substances, list):
-                    substances = ["Analysis not available"]
                 if not isinstance(relationships_data, list):
                     relationships_data = []
-                if not isinstance(mitigation_tips, list):
-                    mitigation_tips = ["General healthy eating advice applies"]
-
-                # Process ingredient quantities from JSON
-                ingredient_quantities = []
-                for qty_data in quantities_data:
-                    if isinstance(qty_data, dict) and 'name' in qty_data:
-                        name = qty_data['name']
-                        original_amount = qty_data.get('original_amount')
-                        gram_amount = qty_data.get('gram_amount')
-
-                        # Validate gram_amount
-                        if gram_amount is not None:
-                            try:
-                                gram_amount = float(gram_amount)
-                                if gram_amount < 0 or gram_amount > 5000:
-                                    logger.warning(f"Invalid gram amount {gram_amount} for {name}, setting to None")
-                                    gram_amount = None
-                            except (ValueError, TypeError):
-                                gram_amount = None
-
-                        ingredient_quantities.append(IngredientQuantity(
-                            name=name,
-                            original_amount=original_amount if original_amount and str(original_amount).lower() not in ['unknown', 'none', ''] else None,
-                            gram_amount=gram_amount,
-                            per_person=portion_for_one
-                        ))
 
                 # Process substance relationships from JSON
                 substance_relationships = []
@@ -782,16 +824,6 @@ class FoodAnalyzer:
                             contributions=contributions
                         ))
 
-                # Create ingredient quantities from ingredients list if not already parsed
-                if not ingredient_quantities and ingredients:
-                    for ingredient in ingredients:
-                        ingredient_quantities.append(IngredientQuantity(
-                            name=ingredient,
-                            original_amount=None,
-                            gram_amount=None,
-                            per_person=portion_for_one
-                        ))
-
                 # Create basic substance relationships if not already parsed
                 if not substance_relationships and substances:
                     for substance in substances:
@@ -805,28 +837,6 @@ class FoodAnalyzer:
                         )
                         substance_relationships.append(relationship)
 
-                # Ensure we have reasonable defaults
-                if not ingredients:
-                    ingredients = ["Unable to determine ingredients"]
-                    ingredient_quantities = [IngredientQuantity(
-                        name="Unable to determine ingredients",
-                        original_amount=None,
-                        gram_amount=None,
-                        per_person=portion_for_one
-                    )]
-                if not substances:
-                    substances = ["Analysis not available"]
-                    substance_relationships = [SubstanceRelationship(
-                        name="Analysis not available",
-                        category='unknown',
-                        health_impact='neutral',
-                        total_quantity=None,
-                        unit='units',
-                        contributions=[]
-                    )]
-                if not mitigation_tips:
-                    mitigation_tips = ["General healthy eating advice applies"]
-
                 # Ensure substances and relationships stay synchronized
                 # Create a set of substance names that have relationships
                 substances_with_relationships = set(sr.name for sr in substance_relationships)
@@ -848,8 +858,9 @@ class FoodAnalyzer:
                 # For relationships, only keep those whose names are in the final substances list
                 substance_relationships = [sr for sr in substance_relationships if sr.name in substances]
 
-                # Generate categorized tips
-                categorized_tips = self._generate_categorized_tips(food_name, ingredients, substances)
+                # Categorized tips arrive in the same response now; just
+                # build the structured objects locally
+                categorized_tips = _build_categorized_tips(parsed_data.get('categorized_tips'))
 
                 return ingredients, ingredient_quantities, substances, substance_relationships, mitigation_tips, categorized_tips
 
@@ -873,17 +884,7 @@ class FoodAnalyzer:
                 unit='units',
                 contributions=[]
             )
-            fallback_categorized_tips = [
-                CategorizedTip(
-                    id=str(uuid.uuid4()),
-                    category=TipCategory.LIFESTYLE,
-                    title="General Healthy Eating",
-                    content="Practice mindful eating and maintain balanced nutrition.",
-                    priority='medium',
-                    relevance_score=0.5,
-                    tags=["general", "health"]
-                )
-            ]
+            fallback_categorized_tips = _default_categorized_tips()
             return (
                 ["Unable to determine ingredients"],
                 [fallback_quantity],
@@ -1004,112 +1005,23 @@ class FoodAnalyzer:
             logger.error(f"Error generating tips: {str(e)}")
             return ["General healthy eating advice applies"]
 
-    def _generate_categorized_tips(self, food_name: str, ingredients: List[str], substances: List[str]) -> List[CategorizedTip]:
-        """Generate categorized health tips with structured format"""
-        prompt = f"""
-        For the food "{food_name}" with ingredients: {', '.join(ingredients)}
-        and beneficial substances: {', '.join(substances)}
-
-        Please provide healthy tips categorized into the following areas:
-        1. Exercise - Physical activity and fitness recommendations
-        2. Food - Dietary suggestions and meal planning
-        3. Drink - Hydration and beverage recommendations
-        4. Lifestyle - General wellness and daily habits
-        5. Nutrition - Specific nutrient-focused advice
-        6. Wellness - Holistic health and preventive care
-        7. Mindset - Mental health and attitude recommendations
-
-        For each category, provide 1-2 relevant tips based on the food analysis.
-        Format your response as JSON with the following structure:
-        {{
-            "exercise": ["tip 1", "tip 2"],
-            "food": ["tip 1", "tip 2"],
-            "drink": ["tip 1"],
-            "lifestyle": ["tip 1"],
-            "nutrition": ["tip 1", "tip 2"],
-            "wellness": ["tip 1"],
-            "mindset": ["tip 1"]
-        }}
-
-        Only include categories that have relevant tips. Focus on practical, actionable advice.
-        """
-
-        try:
-            response = self.client.chat.completions.create(
-                model=self.model,
-                messages=[{"role": "user", "content": prompt}],
-                max_tokens=800,
-                temperature=0.4
-            )
-
-            import json
-            tips_json = response.choices[0].message.content.strip()
-
-            # Extract JSON from response (handle potential markdown formatting)
-            if tips_json.startswith('```json'):
-                tips_json = tips_json[7:]
-            if tips_json.endswith('```'):
-                tips_json = tips_json[:-3]
-
-            tips_data = json.loads(tips_json.strip())
-
-            categorized_tips = []
-            for category_str, tips_list in tips_data.items():
-                try:
-                    category = TipCategory(category_str.lower())
-                    for i, tip_text in enumerate(tips_list):
-                        if tip_text and tip_text.strip():
-                            # Create title from first part of tip
-                            title = tip_text.strip()
-                            if len(title) > 50:
-                                title = title[:47] + "..."
-
-                            tip = CategorizedTip(
-                                id=str(uuid.uuid4()),
-                                category=category,
-                                title=title,
-                                content=tip_text.strip(),
-                                priority='high' if i == 0 else 'medium',
-                                relevance_score=0.9 if i == 0 else 0.7,
-                                tags=[category_str.lower(), "health"]
-                            )
-                            categorized_tips.append(tip)
-                except ValueError:
-                    logger.warning(f"Invalid category: {category_str}")
-                    continue
-
-            return categorized_tips[:10]  # Limit to 10 tips max
-
-        except Exception as e:
-            logger.error(f"Error generating categorized tips: {str(e)}")
-            # Return fallback categorized tips
-            return [
-                CategorizedTip(
-                    id=str(uuid.uuid4()),
-                    category=TipCategory.LIFESTYLE,
-                    title="General Healthy Eating",
-                    content="Practice mindful eating and maintain balanced nutrition.",
-                    priority='medium',
-                    relevance_score=0.5,
-                    tags=["general", "health"]
-                )
-            ]
 
     def _generate_personalized_recommendations(
         self,
         food_name: str,
-        ingredients: List[str],
-        substances: List[str],
         user_profile
     ) -> List[str]:
-        """Step 4: Generate personalized recommendations based on user profile"""
+        """Step 4: Generate personalized recommendations based on user profile
+
+        Depends only on the food name and profile, so callers can run it
+        concurrently with the comprehensive analysis call.
+        """
         age_group = user_profile.age_group
         weight = user_profile.weight
         height = user_profile.height
 
         prompt = f"""
-        Based on the food "{food_name}" with ingredients: {', '.join(ingredients)}
-        and beneficial substances: {', '.join(substances)}
+        Based on the food "{food_name}"
 
         User profile:
         - Age group: {age_group}
@@ -1163,6 +1075,13 @@ class FoodAnalyzer:
 
     def _get_mock_response_with_profile(self, food_name: str, user_profile=None) -> Dict[str, Any]:
         """Return mock response when API key is not available (with profile support)"""
+        # Mock content only varies with the profile values, so rebuild the
+        # model-object tree once per profile and serve copies from the cache
+        cache_key = ('mock', self._profile_key(user_profile))
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         personalized_recommendations = None
         if user_profile:
             personalized_recommendations = [
@@ -1270,7 +1189,7 @@ class FoodAnalyzer:
             )
         ]
 
-        return FoodAnalysisResponse(
+        return self._store_result(cache_key, FoodAnalysisResponse(
             ingredients=["Sample ingredient 1", "Sample ingredient 2", "Sample ingredient 3"],
             ingredient_quantities=mock_quantities,
             substances=["Vitamin C", "Antioxidants", "Fiber"],
@@ -1284,7 +1203,7 @@ class FoodAnalyzer:
             disclaimer=self.disclaimer,
             portion_for_one=True,
             personalized_recommendations=personalized_recommendations
-        ).to_dict()
+        ).to_dict())
 
     def _get_mock_response(self, food_name: str) -> Dict[str, Any]:
         """Return mock response when API key is not available"""
@@ -1292,6 +1211,12 @@ class FoodAnalyzer:
 
     def _get_fallback_response(self, food_name: str) -> Dict[str, Any]:
         """Return fallback response when analysis fails"""
+        # Static apart from the tip id; build once and serve copies
+        cache_key = ('fallback',)
+        cached = self._cached_result(cache_key)
+        if cached is not None:
+            return cached
+
         fallback_quantity = IngredientQuantity(name="Analysis temporarily unavailable", per_person=True)
         fallback_relationship = SubstanceRelationship(name="Analysis temporarily unavailable")
 
@@ -1308,7 +1233,7 @@ class FoodAnalyzer:
             )
         ]
 
-        return FoodAnalysisResponse(
+        return self._store_result(cache_key, FoodAnalysisResponse(
             ingredients=["Analysis temporarily unavailable"],
             ingredient_quantities=[fallback_quantity],
             substances=["Analysis temporarily unavailable"],
@@ -1317,7 +1242,7 @@ class FoodAnalyzer:
             categorized_tips=fallback_categorized_tips,
             disclaimer=self.disclaimer,
             portion_for_one=True
-        ).to_dict()
+        ).to_dict())
 
     def get_recommended_intake(self, nutrients_consumed: List[Dict[str, Any]], age_group: str = "18-29", gender: str = "general") -> Dict[str, Any]:
         """
@@ -1330,7 +1255,7 @@ class FoodAnalyzer:
 
             # Use AI to generate recommended intake based on consumed nutrients
             result = self._analyze_recommended_intake_with_ai(nutrients_consumed, age_group, gender)
-            print(f"Generated recommended intake for {len(nutrients_consumed)} nutrients")
+            logger.debug("Generated recommended intake for %d nutrients", len(nutrients_consumed))
             return result
 
         except Exception as e:
@@ -1348,7 +1273,7 @@ class FoodAnalyzer:
 
             # Use AI to generate recommended weekly intake based on consumed nutrients
             result = self._analyze_weekly_recommended_intake_with_ai(nutrients_consumed, age_group, gender)
-            print(f"Generated weekly recommended intake for {len(nutrients_consumed)} nutrients")
+            logger.debug("Generated weekly recommended intake for %d nutrients", len(nutrients_consumed))
             return result
 
         except Exception as e:
@@ -1365,7 +1290,7 @@ class FoodAnalyzer:
         input_data = {
             "nutrients_consumed": nutrients_consumed
         }
-        print(input_data)
+        logger.debug("Input data: %s", input_data)
         prompt = f"{prompt_template}\n\n{json.dumps(input_data)}"
 
         try:
@@ -1380,19 +1305,10 @@ class FoodAnalyzer:
             )
 
             response_text = response.choices[0].message.content.strip()
-            print(response_text)
+            logger.debug("Response text: %s", response_text)
             # Parse JSON response
             try:
-                # Clean up response text to extract JSON
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
-
-                if json_start == -1 or json_end == 0:
-                    logger.warning(f"No JSON object found in response: {response_text[:500]}...")
-                    raise json.JSONDecodeError("No JSON object found", response_text, 0)
-
-                json_content = response_text[json_start:json_end]
-                parsed_data = json.loads(json_content)
+                parsed_data = _extract_json_object(response_text)
 
                 # Validate the response structure
                 if not self._validate_recommended_intake_response(parsed_data):
@@ -1517,9 +1433,20 @@ IMPORTANT NOTES:
             if self.use_mock:
                 return self._get_mock_comprehensive_response(foods)
 
-            # Use the comprehensive nutritional analysis prompt
-            result = self._analyze_foods_with_comprehensive_prompt(foods)
-            print(f"Comprehensive analysis completed for {len(result)} foods")
+            if len(foods) <= _COMPREHENSIVE_CHUNK_SIZE:
+                result = self._analyze_foods_with_comprehensive_prompt(foods)
+            else:
+                # Large lists blow up single-call latency and token limits;
+                # analyze fixed-size chunks in parallel and reassemble in order
+                chunks = [
+                    foods[i:i + _COMPREHENSIVE_CHUNK_SIZE]
+                    for i in range(0, len(foods), _COMPREHENSIVE_CHUNK_SIZE)
+                ]
+                result = []
+                for chunk_result in _analysis_executor.map(
+                        self._analyze_foods_with_comprehensive_prompt, chunks):
+                    result.extend(chunk_result)
+            logger.debug("Comprehensive analysis completed for %d foods", len(result))
             return result
 
         except Exception as e:
@@ -1611,7 +1538,7 @@ VALIDATION
             )
 
             response_text = response.choices[0].message.content.strip()
-            print(response_text)
+            logger.debug("Response text: %s", response_text)
             # Parse JSON response
             try:
                 # Clean up response text to extract JSON
@@ -1623,7 +1550,7 @@ VALIDATION
                     raise json.JSONDecodeError("No JSON array found", response_text, 0)
 
                 json_content = response_text[json_start:json_end]
-                parsed_data = json.loads(json_content)
+                parsed_data = orjson.loads(json_content)
 
                 # Validate that we got the expected structure
                 if not isinstance(parsed_data, list):
@@ -1645,7 +1572,7 @@ VALIDATION
                 if repaired_json:
                     logger.info("Successfully repaired incomplete JSON, retrying parse...")
                     try:
-                        parsed_data = json.loads(repaired_json)
+                        parsed_data = orjson.loads(repaired_json)
 
                         # Validate that we got the expected structure
                         if not isinstance(parsed_data, list):
@@ -1702,7 +1629,7 @@ VALIDATION
 
             # Test if the repaired JSON is valid
             try:
-                json.loads(repaired)
+                orjson.loads(repaired)
                 logger.info("Repaired JSON is valid")
                 return repaired
             except json.JSONDecodeError as e:
@@ -1880,7 +1807,7 @@ VALIDATION
         input_data = {
             "nutrients_consumed": nutrients_consumed
         }
-        print(input_data)
+        logger.debug("Input data: %s", input_data)
         prompt = f"{prompt_template}\n\n{json.dumps(input_data)}"
 
         try:
@@ -1895,19 +1822,10 @@ VALIDATION
             )
 
             response_text = response.choices[0].message.content.strip()
-            print(response_text)
+            logger.debug("Response text: %s", response_text)
             # Parse JSON response
             try:
-                # Clean up response text to extract JSON
-                json_start = response_text.find('{')
-                json_end = response_text.rfind('}') + 1
-
-                if json_start == -1 or json_end == 0:
-                    logger.warning(f"No JSON object found in response: {response_text[:500]}...")
-                    raise json.JSONDecodeError("No JSON object found", response_text, 0)
-
-                json_content = response_text[json_start:json_end]
-                parsed_data = json.loads(json_content)
+                parsed_data = _extract_json_object(response_text)
 
                 # Validate the response structure
                 if not self._validate_recommended_intake_response(parsed_data):
@@ -2202,7 +2120,7 @@ IMPORTANT NOTES:
             if cleaned_response.endswith("```"):
                 cleaned_response = cleaned_response[:-3]
 
-            parsed_data = json.loads(cleaned_response.strip())
+            parsed_data = orjson.loads(cleaned_response.strip())
 
             # Validate structure
             if not isinstance(parsed_data, dict):
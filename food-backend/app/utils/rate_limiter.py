@@ -1,17 +1,64 @@
 import time
-from collections import defaultdict
+import threading
 import logging
 import os
 
+from cachetools import TTLCache
+
 logger = logging.getLogger(__name__)
 
 class RateLimiter:
     """Simple IP-based rate limiter for API protection"""
 
+    # Upper bound on distinct client IPs tracked at once
+    MAX_TRACKED_IPS = 100_000
+
     def __init__(self):
-        self.requests = defaultdict(list)
         self.max_requests = int(os.getenv('MAX_REQUESTS_PER_MINUTE', '10'))
         self.window_seconds = 60  # 1 minute window
+        # Entries expire on their own once an IP has been idle for two
+        # windows, so no explicit cleanup sweep is needed
+        self.requests = TTLCache(maxsize=self.MAX_TRACKED_IPS,
+                                 ttl=self.window_seconds * 2)
+        self._lock = threading.Lock()
+
+    def try_consume(self, client_ip: str) -> bool:
+        """Atomically check the rate limit and record the request if allowed
+
+        Combines is_allowed() + record_request() into one pass under a single
+        lock, so concurrent requests cannot both slip under the limit.
+        """
+        current_time = time.time()
+
+        # Fast deny without the lock: if the IP's newest max_requests
+        # timestamps are all inside the window, this request cannot succeed
+        # no matter how the race resolves, so skip the lock entirely. Clients
+        # hammering a 429 stop contending with requests that might pass.
+        timestamps = self.requests.get(client_ip)
+        if (timestamps is not None
+                and len(timestamps) >= self.max_requests
+                and timestamps[-self.max_requests] > current_time - self.window_seconds):
+            logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+            return False
+
+        with self._lock:
+            # Clean old requests outside the window
+            window_start = current_time - self.window_seconds
+            timestamps = [
+                req_time for req_time in self.requests.get(client_ip, ())
+                if req_time > window_start
+            ]
+
+            if len(timestamps) < self.max_requests:
+                timestamps.append(current_time)
+                # Reassignment also refreshes the entry's TTL
+                self.requests[client_ip] = timestamps
+                return True
+
+            self.requests[client_ip] = timestamps
+
+        logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+        return False
 
     def is_allowed(self, client_ip: str) -> bool:
         """Check if request is allowed based on rate limit"""
@@ -19,7 +66,7 @@ class RateLimiter:
 
         # Clean old requests outside the window
         self.requests[client_ip] = [
-            req_time for req_time in self.requests[client_ip]
+            req_time for req_time in self.requests.get(client_ip, ())
             if current_time - req_time < self.window_seconds
         ]
 
@@ -33,33 +80,18 @@ class RateLimiter:
 
     def record_request(self, client_ip: str):
         """Record a request for rate limiting"""
-        current_time = time.time()
-        self.requests[client_ip].append(current_time)
-
-        # Clean up old entries periodically
-        if len(self.requests) > 1000:  # Prevent memory leak
-            self._cleanup_old_entries()
-
-    def _cleanup_old_entries(self):
-        """Clean up old entries to prevent memory leaks"""
-        current_time = time.time()
-        cutoff_time = current_time - (self.window_seconds * 2)
-
-        for ip in list(self.requests.keys()):
-            self.requests[ip] = [
-                req_time for req_time in self.requests[ip]
-                if req_time > cutoff_time
-            ]
-            # Remove empty lists
-            if not self.requests[ip]:
-                del self.requests[ip]
+        timestamps = self.requests.get(client_ip)
+        if timestamps is None:
+            timestamps = []
+        timestamps.append(time.time())
+        self.requests[client_ip] = timestamps
 
     def get_remaining_requests(self, client_ip: str) -> int:
         """Get remaining requests allowed for this IP"""
         current_time = time.time()
         # Clean old requests
         self.requests[client_ip] = [
-            req_time for req_time in self.requests[client_ip]
+            req_time for req_time in self.requests.get(client_ip, ())
             if current_time - req_time < self.window_seconds
         ]
 
@@ -1,40 +1,54 @@
 import re
-from typing import Dict, Any
+from functools import lru_cache
+from typing import Dict, Any, Optional, Tuple
 
+# Compiled once at import; validate_food_name runs per food item per request
+_HARMFUL_PATTERN = re.compile(r'[<>{}[\]\\]')
+_SPECIAL_CHAR_PATTERN = re.compile(r'[^a-zA-Z0-9\s\-&\(\)\.]')
+_SQL_PATTERN = re.compile(r'(union|select|insert|delete|update|drop|create)', re.IGNORECASE)
+_WHITESPACE_PATTERN = re.compile(r'\s+')
+_TAG_PATTERN = re.compile(r'<[^>]*>')
 
-def validate_food_name(food_name: str) -> Dict[str, Any]:
-    """
-    Validate food name input
-    Returns: {"valid": bool, "error": str or None}
-    """
+
+@lru_cache(maxsize=4096)
+def _validate_food_name_cached(food_name: str) -> Tuple[bool, Optional[str]]:
+    """Run the actual validation; memoized since food names repeat heavily"""
     if not food_name or not food_name.strip():
-        return {"valid": False, "error": "Food name cannot be empty"}
+        return False, "Food name cannot be empty"
 
     food_name = food_name.strip()
 
     # Check length
     if len(food_name) < 2:
-        return {"valid": False, "error": "Food name is too short"}
+        return False, "Food name is too short"
 
     if len(food_name) > 100:
-        return {"valid": False, "error": "Food name is too long (max 100 characters)"}
+        return False, "Food name is too long (max 100 characters)"
 
     # Check for potentially harmful characters
-    harmful_patterns = re.compile(r'[<>{}[\]\\]')
-    if harmful_patterns.search(food_name):
-        return {"valid": False, "error": "Food name contains invalid characters"}
+    if _HARMFUL_PATTERN.search(food_name):
+        return False, "Food name contains invalid characters"
 
     # Check for excessive special characters
-    special_chars = re.findall(r'[^a-zA-Z0-9\s\-&\(\)\.]', food_name)
-    if len(special_chars) > 5:
-        return {"valid": False, "error": "Food name contains too many special characters"}
+    if len(_SPECIAL_CHAR_PATTERN.findall(food_name)) > 5:
+        return False, "Food name contains too many special characters"
 
     # Check for common SQL injection patterns (basic protection)
-    sql_patterns = re.compile(r'(union|select|insert|delete|update|drop|create)', re.IGNORECASE)
-    if sql_patterns.search(food_name):
-        return {"valid": False, "error": "Invalid food name"}
+    if _SQL_PATTERN.search(food_name):
+        return False, "Invalid food name"
+
+    return True, None
 
-    return {"valid": True, "error": None}
+
+def validate_food_name(food_name: str) -> Dict[str, Any]:
+    """
+    Validate food name input
+    Returns: {"valid": bool, "error": str or None}
+    """
+    # Cache an immutable tuple and build the dict per call, so callers can
+    # do what they like with the returned dict
+    valid, error = _validate_food_name_cached(food_name)
+    return {"valid": valid, "error": error}
 
 
 def sanitize_input(text: str) -> str:
@@ -43,9 +57,9 @@ def sanitize_input(text: str) -> str:
         return ""
 
     # Remove excessive whitespace
-    text = re.sub(r'\s+', ' ', text.strip())
+    text = _WHITESPACE_PATTERN.sub(' ', text.strip())
 
     # Remove potential script tags (basic XSS protection)
-    text = re.sub(r'<[^>]*>', '', text)
+    text = _TAG_PATTERN.sub('', text)
 
     return text
@@ -45,7 +45,7 @@ def process_food_analysis(event, context):
             job_data = message_body.get('job_data', {})
 
             job_type = job_data.get('job_type', 'food_analysis')
-            logger.info(f"Processing job {job_id} of type {job_type}")
+            logger.info("Processing job %s of type %s", job_id, job_type)
 
             # Update job status to processing
             job_manager.update_job_status(job_id, 'processing')
@@ -82,10 +82,10 @@ def process_food_analysis(event, context):
                 # Update job with completed result
                 job_manager.update_job_status(job_id, 'completed', result_decimals)
 
-                logger.info(f"Successfully completed job {job_id} of type {job_type}")
+                logger.info("Successfully completed job %s of type %s", job_id, job_type)
 
             except Exception as e:
-                logger.error(f"Error processing job {job_id}: {str(e)}")
+                logger.error("Error processing job %s: %s", job_id, e)
 
                 # Update job with error status
                 job_manager.update_job_status(job_id, 'failed', error=str(e))
@@ -93,5 +93,5 @@ def process_food_analysis(event, context):
         return {'statusCode': 200, 'body': 'Processing completed'}
 
     except Exception as e:
-        logger.error(f"Error in async handler: {str(e)}")
+        logger.error("Error in async handler: %s", e)
         return {'statusCode': 500, 'body': str(e)}
@@ -31,5 +31,8 @@ def handler(event, context):
         logger.info("Warm-up event received - keeping function warm")
         return {'statusCode': 200, 'body': 'Warm-up successful'}
 
-    logger.info(f"Processing request: {event.get('requestContext', {}).get('httpMethod', 'UNKNOWN')} {event.get('requestContext', {}).get('path', 'UNKNOWN')}")
+    request_context = event.get('requestContext', {})
+    logger.info("Processing request: %s %s",
+                request_context.get('httpMethod', 'UNKNOWN'),
+                request_context.get('path', 'UNKNOWN'))
     return handle_request(get_app(), event, context)